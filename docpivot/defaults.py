@@ -1,17 +1,14 @@
-"""Smart defaults for DocPivot operations."""
-
-from typing import Any
+"""Smart defaults for DocPivot operations.
 
+Each preset is built once at import as a read-only template; the public
+getters return a fresh copy so callers can modify the result freely.
+"""
 
-def get_default_lexical_config() -> dict[str, Any]:
-    """Get default configuration for Lexical JSON serialization.
-
-    Returns configuration that handles 90% of use cases.
+from types import MappingProxyType
+from typing import Any
 
-    Returns:
-        Dict containing default Lexical serialization options
-    """
-    return {
+_DEFAULT_LEXICAL_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": False,  # Compact by default
         "indent": 2,  # If pretty=True
         "include_metadata": True,
@@ -22,34 +19,20 @@ def get_default_lexical_config() -> dict[str, Any]:
         "include_headers": True,
         "include_paragraphs": True,
     }
+)
 
-
-def get_performance_config() -> dict[str, Any]:
-    """Get configuration optimized for performance.
-
-    Minimizes output size and processing overhead.
-
-    Returns:
-        Dict containing performance-optimized configuration
-    """
-    return {
+_PERFORMANCE_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": False,
         "include_metadata": False,
         "handle_images": False,
         "include_debug_info": False,
         "validate_output": False,
     }
+)
 
-
-def get_debug_config() -> dict[str, Any]:
-    """Get configuration for debugging/development.
-
-    Maximizes information output for troubleshooting.
-
-    Returns:
-        Dict containing debug-friendly configuration
-    """
-    return {
+_DEBUG_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": True,
         "indent": 4,
         "include_metadata": True,
@@ -58,15 +41,10 @@ def get_debug_config() -> dict[str, Any]:
         "handle_images": True,
         "include_raw_text": True,
     }
+)
 
-
-def get_minimal_config() -> dict[str, Any]:
-    """Get minimal configuration for text-only output.
-
-    Returns:
-        Dict containing minimal configuration options
-    """
-    return {
+_MINIMAL_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": False,
         "include_metadata": False,
         "handle_images": False,
@@ -75,15 +53,10 @@ def get_minimal_config() -> dict[str, Any]:
         "include_headers": True,
         "include_paragraphs": True,
     }
+)
 
-
-def get_full_config() -> dict[str, Any]:
-    """Get configuration with all features enabled.
-
-    Returns:
-        Dict containing full-featured configuration
-    """
-    return {
+_FULL_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": True,
         "indent": 2,
         "include_metadata": True,
@@ -96,15 +69,10 @@ def get_full_config() -> dict[str, Any]:
         "include_footnotes": True,
         "include_raw_text": True,
     }
+)
 
-
-def get_web_config() -> dict[str, Any]:
-    """Get configuration optimized for web display.
-
-    Returns:
-        Dict containing web-optimized configuration
-    """
-    return {
+_WEB_CONFIG: MappingProxyType[str, Any] = MappingProxyType(
+    {
         "pretty": False,  # Minimize size for transfer
         "include_metadata": True,
         "handle_tables": True,
@@ -114,6 +82,67 @@ def get_web_config() -> dict[str, Any]:
         "include_paragraphs": True,
         "sanitize_html": True,  # Safety for web display
     }
+)
+
+
+def get_default_lexical_config() -> dict[str, Any]:
+    """Get default configuration for Lexical JSON serialization.
+
+    Returns configuration that handles 90% of use cases.
+
+    Returns:
+        Dict containing default Lexical serialization options
+    """
+    return _DEFAULT_LEXICAL_CONFIG.copy()
+
+
+def get_performance_config() -> dict[str, Any]:
+    """Get configuration optimized for performance.
+
+    Minimizes output size and processing overhead.
+
+    Returns:
+        Dict containing performance-optimized configuration
+    """
+    return _PERFORMANCE_CONFIG.copy()
+
+
+def get_debug_config() -> dict[str, Any]:
+    """Get configuration for debugging/development.
+
+    Maximizes information output for troubleshooting.
+
+    Returns:
+        Dict containing debug-friendly configuration
+    """
+    return _DEBUG_CONFIG.copy()
+
+
+def get_minimal_config() -> dict[str, Any]:
+    """Get minimal configuration for text-only output.
+
+    Returns:
+        Dict containing minimal configuration options
+    """
+    return _MINIMAL_CONFIG.copy()
+
+
+def get_full_config() -> dict[str, Any]:
+    """Get configuration with all features enabled.
+
+    Returns:
+        Dict containing full-featured configuration
+    """
+    return _FULL_CONFIG.copy()
+
+
+def get_web_config() -> dict[str, Any]:
+    """Get configuration optimized for web display.
+
+    Returns:
+        Dict containing web-optimized configuration
+    """
+    return _WEB_CONFIG.copy()
 
 
 def merge_configs(*configs: dict[str, Any]) -> dict[str, Any]:
@@ -1,5 +1,6 @@
 """DocPivotEngine - Simple API for document format conversion."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,6 +19,7 @@ except ImportError:
     else:
         DocumentConverter = None  # type: ignore[assignment, misc]
 
+from docpivot.io.readers.doclingjsonreader import DoclingJsonReader
 from docpivot.io.readers.readerfactory import ReaderFactory
 from docpivot.io.serializers.lexicaldocserializer import LexicalDocSerializer
 
@@ -96,10 +98,17 @@ class DocPivotEngine:
             # Re-init with new document
             self._serializer = LexicalDocSerializer(document)
 
-        # Merge configurations
-        config = {**self.lexical_config, **kwargs}
-        if pretty:
-            config["pretty"] = True
+        # Merge configurations; without per-call overrides the engine config
+        # is read as-is rather than copied for every document
+        config = {**self.lexical_config, **kwargs} if kwargs else self.lexical_config
+
+        # Indent only when pretty output is requested; compact JSON is about
+        # half the size and much cheaper for downstream parsers
+        indent_json = pretty or bool(config.get("pretty", False))
+        self._serializer.params.indent_json = indent_json
+        if indent_json:
+            # Compact output never uses the indent, so it is only read here
+            self._serializer.params.json_indent = config.get("indent", 2)
 
         # Serialize
         result = self._serializer.serialize()
@@ -116,7 +125,7 @@ class DocPivotEngine:
             content=result.text,
             format="lexical",
             metadata={
-                "pretty": pretty,
+                "pretty": self._serializer.params.indent_json,
                 "document_name": document.name if hasattr(document, "name") else None,
                 "elements_count": elements_count,
             },
@@ -152,11 +161,41 @@ class DocPivotEngine:
 
         # Write to file if requested
         if output_path:
-            Path(output_path).write_text(result.content)
+            # Encode once and write the bytes, skipping the text I/O layer
+            Path(output_path).write_bytes(result.content.encode("utf-8"))
             result.metadata["output_path"] = str(output_path)
 
         return result
 
+    def convert_stream(
+        self, input_path: str | Path, output_format: str = "lexical", **kwargs: Any
+    ) -> Iterator[ConversionResult]:
+        """Convert each document in a newline-delimited Docling JSON file.
+
+        The file holds one DoclingDocument JSON object per line. Documents are
+        read, converted and yielded one at a time, so large batches can be
+        processed without loading the whole file.
+
+        Args:
+            input_path: Path to the newline-delimited Docling JSON file
+            output_format: Target format (default: "lexical")
+            **kwargs: Additional conversion options
+
+        Returns:
+            Iterator of ConversionResult, one per document, in file order
+
+        Raises:
+            ValueError: If the output format is not supported
+            FileAccessError: If the input file cannot be accessed
+        """
+        if output_format != "lexical":
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        # iter_documents checks the file now, so a missing input fails here
+        # rather than on the first next() of the returned iterator
+        documents = DoclingJsonReader().iter_documents(input_path)
+        return (self.convert_to_lexical(document, **kwargs) for document in documents)
+
     def convert_pdf(
         self, pdf_path: str | Path, output_format: str = "lexical", **kwargs: Any
     ) -> ConversionResult:
@@ -1,16 +1,37 @@
 """Builder pattern for DocPivotEngine configuration."""
 
+from types import MappingProxyType
 from typing import Any
 
 from docpivot.engine import DocPivotEngine
 
+# Settings applied by the mode shortcuts, built once at import
+_PERFORMANCE_MODE: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "pretty": False,
+        "include_metadata": False,
+        "handle_images": False,
+    }
+)
+
+_DEBUG_MODE: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "pretty": True,
+        "indent": 4,
+        "include_metadata": True,
+        "handle_images": True,
+    }
+)
+
 
 class DocPivotEngineBuilder:
     """Fluent builder for DocPivotEngine with advanced configuration."""
 
     def __init__(self) -> None:
         """Initialize the builder with default values."""
-        self._lexical_config: dict[str, Any] = {}
+        # Lexical settings in the order they were given; build() merges them
+        # into a single dict once, so later settings override earlier ones
+        self._pending: list[tuple[str, Any]] = []
         self._default_format = "lexical"
         self._custom_serializers: dict[str, Any] = {}
         self._custom_readers: dict[str, Any] = {}
@@ -24,7 +45,7 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config.update(config)
+        self._pending.extend(config.items())
         return self
 
     def with_pretty_print(self, indent: int = 2) -> "DocPivotEngineBuilder":
@@ -36,8 +57,8 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config["pretty"] = True
-        self._lexical_config["indent"] = indent
+        self._pending.append(("pretty", True))
+        self._pending.append(("indent", indent))
         return self
 
     def with_default_format(self, format: str) -> "DocPivotEngineBuilder":
@@ -93,7 +114,7 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config["handle_images"] = include
+        self._pending.append(("handle_images", include))
         return self
 
     def with_metadata(self, include: bool = True) -> "DocPivotEngineBuilder":
@@ -105,7 +126,7 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config["include_metadata"] = include
+        self._pending.append(("include_metadata", include))
         return self
 
     def with_performance_mode(self) -> "DocPivotEngineBuilder":
@@ -114,13 +135,7 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config.update(
-            {
-                "pretty": False,
-                "include_metadata": False,
-                "handle_images": False,
-            }
-        )
+        self._pending.extend(_PERFORMANCE_MODE.items())
         return self
 
     def with_debug_mode(self) -> "DocPivotEngineBuilder":
@@ -129,14 +144,7 @@ class DocPivotEngineBuilder:
         Returns:
             Self for method chaining
         """
-        self._lexical_config.update(
-            {
-                "pretty": True,
-                "indent": 4,
-                "include_metadata": True,
-                "handle_images": True,
-            }
-        )
+        self._pending.extend(_DEBUG_MODE.items())
         return self
 
     def build(self) -> DocPivotEngine:
@@ -145,9 +153,8 @@ class DocPivotEngineBuilder:
         Returns:
             Configured DocPivotEngine instance
         """
-        return DocPivotEngine(
-            lexical_config=self._lexical_config, default_format=self._default_format
-        )
+        lexical_config = dict(self._pending)
+        return DocPivotEngine(lexical_config=lexical_config, default_format=self._default_format)
 
         # Future: Register custom serializers and readers if any
         # for format, serializer in self._custom_serializers.items():
@@ -1,11 +1,37 @@
 """Base reader class following Docling patterns."""
 
+import codecs
+import mmap
+import os
+import stat
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from docling_core.types import DoclingDocument
 
+# Number of leading bytes read from a file for content-based format detection
+FORMAT_PROBE_BYTES = 1024
+
+# Fixed tail of the unsupported-format error message
+FORMAT_ERROR_GUIDANCE = (
+    "This file format is not supported by this reader.\n"
+    "Consider subclassing BaseReader to add support for this format."
+)
+
+
+@lru_cache(maxsize=256)
+def _peek_file_head(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read the first FORMAT_PROBE_BYTES of a file.
+
+    Cached by (path, mtime, size) so every reader probing the same unchanged
+    file during format detection shares one read.
+    """
+    # Unbuffered: a single small read does not need an 8KB buffer
+    with Path(path).open("rb", buffering=0) as f:
+        return f.read(FORMAT_PROBE_BYTES)
+
 
 class BaseReader(ABC):
     """Base class for document readers following Docling's reader pattern."""
@@ -71,16 +97,36 @@ class BaseReader(ABC):
         Returns:
             Path: Validated file path.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IsADirectoryError: If the path points to a directory.
+        """
+        return self._stat_existing_file(file_path)[0]
+
+    def _stat_existing_file(self, file_path: str | Path) -> tuple[Path, os.stat_result]:
+        """Validate that the file exists and return it with its stat result.
+
+        Uses a single stat() call for both checks, and hands the result back
+        so callers that need the size or mtime do not stat the file again.
+
+        Args:
+            file_path: File path to validate.
+
+        Returns:
+            tuple[Path, os.stat_result]: Validated file path and its stat result.
+
         Raises:
             FileNotFoundError: If the file does not exist.
             IsADirectoryError: If the path points to a directory.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-        if path.is_dir():
+        try:
+            file_stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+        if stat.S_ISDIR(file_stat.st_mode):
             raise IsADirectoryError(f"Path is a directory: {file_path}")
-        return path
+        return path, file_stat
 
     def _get_format_error_message(self, file_path: str | Path) -> str:
         """Generate a descriptive error message for unsupported file format.
@@ -91,11 +137,60 @@ class BaseReader(ABC):
         Returns:
             str: Error message describing the issue and how to add support.
         """
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        extension = path.suffix.lower() or "unknown"
+        return f"Unsupported file format: {extension} ({path.name})\n{FORMAT_ERROR_GUIDANCE}"
+
+    def _read_file_head(self, file_path: str | Path) -> bytes:
+        """Return the leading bytes of a file for content-based format detection.
+
+        Args:
+            file_path: File to read.
+
+        Returns:
+            bytes: Up to FORMAT_PROBE_BYTES bytes from the start of the file.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
         path = Path(file_path)
-        extension = path.suffix.lower() if path.suffix else "unknown"
+        file_stat = path.stat()
+        return _peek_file_head(str(path.absolute()), file_stat.st_mtime_ns, file_stat.st_size)
+
+    @staticmethod
+    def _advise_sequential(mapped: mmap.mmap) -> None:
+        """Hint the kernel that a mapped file will be read front to back.
+
+        Parsers scan the mapping once from start to end, so aggressive
+        read-ahead keeps them from stalling on page faults. A no-op where
+        madvise is unavailable.
 
-        return (
-            f"Unsupported file format: {extension} ({path.name})\n"
-            f"This file format is not supported by this reader.\n"
-            f"Consider subclassing BaseReader to add support for this format."
-        )
+        Args:
+            mapped: Memory map of the file about to be parsed.
+        """
+        advice = getattr(mmap, "MADV_SEQUENTIAL", None)
+        if advice is not None:
+            mapped.madvise(advice)
+
+    @staticmethod
+    def _is_utf8_head(chunk: bytes) -> bool:
+        """Check that a chunk read from the start of a file is valid UTF-8.
+
+        Pure-ASCII chunks (no byte with the high bit set) are valid UTF-8 by
+        definition and skip the decoder entirely. Otherwise the chunk is run
+        through an incremental decoder so a multi-byte character cut off at
+        the end of the chunk is not reported as an error.
+
+        Args:
+            chunk: Leading bytes of a file.
+
+        Returns:
+            bool: True if the chunk is a valid UTF-8 prefix, False otherwise.
+        """
+        if chunk.isascii():
+            return True
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(chunk)
+        except UnicodeDecodeError:
+            return False
+        return True
@@ -175,10 +175,14 @@ class CustomReaderBase(BaseReader):
             Dict[str, Any]: Dictionary of metadata properties
         """
         path = Path(file_path)
+        try:
+            size_bytes = path.stat().st_size
+        except FileNotFoundError:
+            size_bytes = 0
         return {
             "filename": path.name,
             "extension": path.suffix.lower(),
-            "size_bytes": path.stat().st_size if path.exists() else 0,
+            "size_bytes": size_bytes,
             "format_name": self.format_name,
             "reader_version": self.version,
         }
@@ -207,14 +211,16 @@ class CustomReaderBase(BaseReader):
         Raises:
             ValueError: If the configuration is invalid
         """
-        if not self.supported_extensions:
+        # Subclasses usually build the list inside the property, so read it once
+        extensions = self.supported_extensions
+        if not extensions:
             raise ValueError(f"{self.__class__.__name__} must define supported_extensions")
 
         if not self.format_name:
             raise ValueError(f"{self.__class__.__name__} must define format_name")
 
         # Validate extensions format
-        for ext in self.supported_extensions:
+        for ext in extensions:
             if not ext.startswith("."):
                 raise ValueError(f"Extensions must start with '.', got: {ext}")
 
@@ -3,8 +3,9 @@ objects."""
 
 import json
 import mmap
+import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +34,9 @@ DEFAULT_STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024  # 10MB
 DEFAULT_LARGE_FILE_THRESHOLD_BYTES = 100 * 1024 * 1024  # 100MB
 JSON_PARSER_BUFFER_SIZE = 1024 * 1024  # 1MB
 
+# Byte markers that identify DoclingDocument JSON near the start of a file
+DOCLING_CONTENT_MARKERS = (b'"schema_name"', b'"DoclingDocument"', b'"version"')
+
 
 class DoclingJsonReader(BaseReader):
     """Reader for .docling.json files that loads them into DoclingDocument
@@ -62,6 +66,7 @@ class DoclingJsonReader(BaseReader):
         progress_callback: Callable[[float], None] | None = None,
         streaming_threshold_bytes: int = DEFAULT_STREAMING_THRESHOLD_BYTES,
         large_file_threshold_bytes: int = DEFAULT_LARGE_FILE_THRESHOLD_BYTES,
+        use_mmap: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize DoclingJsonReader.
@@ -73,6 +78,7 @@ class DoclingJsonReader(BaseReader):
             progress_callback: Callback for progress updates (receives 0.0-1.0)
             streaming_threshold_bytes: File size threshold for streaming mode
             large_file_threshold_bytes: File size threshold for memory mapping
+            use_mmap: Always load through a memory map, regardless of file size
             **kwargs: Additional configuration parameters
         """
         super().__init__(**kwargs)
@@ -83,12 +89,15 @@ class DoclingJsonReader(BaseReader):
         self.progress_callback = progress_callback
         self.streaming_threshold_bytes = streaming_threshold_bytes
         self.large_file_threshold_bytes = large_file_threshold_bytes
+        self.use_mmap = use_mmap
 
-        # Document cache - key by (absolute_path, size, mtime)
+        # Document cache - key by (absolute_path, inode, size, mtime_ns)
         self._document_cache: dict[tuple, DoclingDocument] = {}
 
         # JSON parser selection
         self._json_parser = self._select_json_parser()
+        # orjson parses UTF-8 bytes directly, so file content need not be decoded first
+        self._parses_bytes = getattr(self._json_parser, "__name__", None) == "orjson"
 
         logger.debug(
             f"DoclingJsonReader initialized with parser: "
@@ -110,31 +119,15 @@ class DoclingJsonReader(BaseReader):
             ValidationError: If the file format is invalid or corrupted
             SchemaValidationError: If the DoclingDocument schema is invalid
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_path_str = str(file_path)
         logger.info(f"Loading DoclingDocument from {file_path_str}")
 
         try:
-            # Check cache first if enabled
-            if self.enable_caching:
-                try:
-                    path = self._validate_file_exists(file_path)
-                    cache_key = self._get_cache_key(path)
-                    if cache_key in self._document_cache:
-                        logger.debug(f"Returning cached document for {file_path_str}")
-                        cached_doc = self._document_cache[cache_key]
-                        duration = (time.time() - start_time) * 1000
-                        logger.debug(f"Cached load completed in {duration:.2f}ms")
-                        return cached_doc
-                except (FileNotFoundError, IsADirectoryError, OSError) as e:
-                    # Continue with normal flow to handle error properly
-                    logger.debug(f"Cache lookup failed for {file_path_str}: {e}")
-                    pass
-
             # Validate file exists and get metadata
             try:
-                path = self._validate_file_exists(file_path)
-                file_size = path.stat().st_size
+                path, file_stat = self._stat_existing_file(file_path)
+                file_size = file_stat.st_size
                 logger.debug(f"File size: {file_size} bytes")
             except FileNotFoundError as e:
                 raise FileAccessError(
@@ -153,8 +146,19 @@ class DoclingJsonReader(BaseReader):
                     cause=e,
                 ) from e
 
-            # Check format detection
-            if not self.detect_format(file_path):
+            # Check cache if enabled, keyed on the stat taken above
+            cache_key = None
+            if self.enable_caching:
+                cache_key = self._get_cache_key(path, file_stat)
+                cached_doc = self._document_cache.get(cache_key)
+                if cached_doc is not None:
+                    logger.debug(f"Returning cached document for {file_path_str}")
+                    duration = (time.perf_counter() - start_time) * 1000
+                    logger.debug(f"Cached load completed in {duration:.2f}ms")
+                    return cached_doc
+
+            # Check format detection (existence was validated above)
+            if not self._matches_format(path):
                 raise UnsupportedFormatError(file_path_str)
 
             # Choose loading strategy based on file size and configuration
@@ -170,13 +174,12 @@ class DoclingJsonReader(BaseReader):
                 document = self._load_standard(path, file_size)
 
             # Cache document if enabled
-            if self.enable_caching:
-                cache_key = self._get_cache_key(path)
+            if cache_key is not None:
                 self._document_cache[cache_key] = document
                 logger.debug(f"Cached document for {file_path_str}")
 
             # Log success metrics
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             logger.info(
                 f"Successfully loaded DoclingDocument from {file_path_str} in {duration:.2f}ms"
             )
@@ -188,13 +191,13 @@ class DoclingJsonReader(BaseReader):
             SchemaValidationError,
             UnsupportedFormatError,
         ):
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             # Log error timing
             logger.error(f"Failed to load DoclingDocument from {file_path} after {duration:.2f}ms")
             raise
         except Exception as e:
             # Handle unexpected errors with comprehensive context
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             context = {
                 "file_path": file_path,
                 "operation": "load_data",
@@ -210,15 +213,97 @@ class DoclingJsonReader(BaseReader):
                 cause=e,
             ) from e
 
+    def iter_documents(self, file_path: str | Path) -> Iterator[DoclingDocument]:
+        """Load DoclingDocuments one at a time from a newline-delimited JSON file.
+
+        Each non-blank line of the file holds one complete DoclingDocument
+        JSON object (JSON Lines / NDJSON). Lines are read through a large
+        buffer and parsed, validated and yielded one by one, so only one
+        document is held in memory at a time however large the file is.
+
+        Args:
+            file_path: Path to the newline-delimited Docling JSON file
+
+        Returns:
+            Iterator[DoclingDocument]: Each document in file order
+
+        Raises:
+            FileAccessError: If the file cannot be accessed (raised on call) or read
+            ValidationError: If a line is not valid JSON; the message names the line
+            SchemaValidationError: If a line is not a valid DoclingDocument
+        """
+        file_path_str = str(file_path)
+        try:
+            path = self._validate_file_exists(file_path)
+        except (FileNotFoundError, IsADirectoryError) as e:
+            raise FileAccessError(
+                f"Cannot read documents from '{file_path_str}': {e}",
+                file_path_str,
+                "check_existence",
+                context={"original_error": str(e)},
+                cause=e,
+            ) from e
+
+        # The file is checked here rather than on the first next() call
+        return self._iter_documents(path, file_path_str)
+
+    def _iter_documents(self, path: Path, file_path_str: str) -> Iterator[DoclingDocument]:
+        """Yield the documents of an already validated newline-delimited file."""
+        logger.info(f"Streaming DoclingDocuments from {file_path_str}")
+        count = 0
+        with path.open("rb", buffering=JSON_PARSER_BUFFER_SIZE) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+
+                # Parse straight from the bytes when possible, as load_data does
+                json_data = self._parse_json_bytes(line)
+                if json_data is None:
+                    try:
+                        content = line.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        raise FileAccessError(
+                            f"Unable to decode line {line_number} of '{file_path_str}' "
+                            f"as UTF-8: {e}",
+                            file_path_str,
+                            "read_text",
+                            context={"encoding": "utf-8", "line_number": line_number},
+                            cause=e,
+                        ) from e
+                    try:
+                        # A bytes-capable parser has already rejected this line,
+                        # so go straight to the standard parser for the error
+                        json_data = (
+                            json.loads(content) if self._parses_bytes else self._parse_json(content)
+                        )
+                    except (json.JSONDecodeError, DocPivotValidationError) as e:
+                        raise DocPivotValidationError(
+                            f"Invalid JSON on line {line_number} of '{file_path_str}': {e}",
+                            error_code="JSON_PARSE_ERROR",
+                            context={"file_path": file_path_str, "line_number": line_number},
+                            cause=e,
+                        ) from e
+
+                yield self._validate_and_create_document(
+                    json_data, f"{file_path_str}:{line_number}"
+                )
+                count += 1
+
+        logger.info(f"Streamed {count} DoclingDocuments from {file_path_str}")
+
     def _choose_loading_strategy(self, file_size: int) -> str:
         """Choose the optimal loading strategy based on file size and configuration."""
+        if self.use_mmap:
+            return "mmap"
         if self.use_streaming is True:
             return "streaming"
         if self.use_streaming is False:
             return "standard" if file_size < self.large_file_threshold_bytes else "mmap"
         # Auto-detect based on file size
         if file_size > self.streaming_threshold_bytes:
-            return "streaming"
+            # A bytes-capable parser (orjson) reads straight from a memory map,
+            # so the file is never copied onto the heap as one large bytes object
+            return "mmap" if self._parses_bytes else "streaming"
         if file_size > self.large_file_threshold_bytes:
             return "mmap"
         return "standard"
@@ -229,19 +314,10 @@ class DoclingJsonReader(BaseReader):
             if self.progress_callback:
                 self.progress_callback(0.1)
 
-            # Read file with encoding detection
+            # Read raw bytes, bypassing the text I/O layer
             try:
-                content = path.read_text(encoding="utf-8")
-                logger.debug(f"Successfully read {len(content)} characters from {path}")
-            except UnicodeDecodeError as e:
-                raise FileAccessError(
-                    f"Unable to decode file '{path}' as UTF-8. "
-                    f"Please ensure the file is properly encoded. Error: {e}",
-                    str(path),
-                    "read_text",
-                    context={"encoding": "utf-8", "original_error": str(e)},
-                    cause=e,
-                ) from e
+                raw = path.read_bytes()
+                logger.debug(f"Successfully read {len(raw)} bytes from {path}")
             except OSError as e:
                 raise FileAccessError(
                     f"Error reading file '{path}': {e}. "
@@ -256,8 +332,21 @@ class DoclingJsonReader(BaseReader):
             if self.progress_callback:
                 self.progress_callback(0.3)
 
-            # Parse JSON with selected parser
-            json_data = self._parse_json(content)
+            # Parse JSON with selected parser, straight from the bytes when possible
+            json_data = self._parse_json_bytes(raw)
+            if json_data is None:
+                try:
+                    content = raw.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    raise FileAccessError(
+                        f"Unable to decode file '{path}' as UTF-8. "
+                        f"Please ensure the file is properly encoded. Error: {e}",
+                        str(path),
+                        "read_text",
+                        context={"encoding": "utf-8", "original_error": str(e)},
+                        cause=e,
+                    ) from e
+                json_data = self._parse_json(content)
 
             if self.progress_callback:
                 self.progress_callback(0.6)
@@ -289,32 +378,39 @@ class DoclingJsonReader(BaseReader):
                 self.progress_callback(0.1)
 
             with (
-                Path(path).open("rb") as f,
+                path.open("rb") as f,
                 mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped_file,
             ):
+                self._advise_sequential(mmapped_file)
                 if self.progress_callback:
                     self.progress_callback(0.3)
 
-                # Read content from memory-mapped file
-                try:
-                    content = mmapped_file.read().decode("utf-8")
-                    logger.debug(
-                        f"Successfully read {len(content)} characters from memory-mapped {path}"
-                    )
-                except UnicodeDecodeError as e:
-                    raise FileAccessError(
-                        f"Unable to decode memory-mapped file '{path}' as UTF-8: {e}",
-                        str(path),
-                        "mmap_decode",
-                        context={"encoding": "utf-8", "original_error": str(e)},
-                        cause=e,
-                    ) from e
-
-                if self.progress_callback:
-                    self.progress_callback(0.6)
-
-                # Parse JSON
-                json_data = self._parse_json(content)
+                # Parse straight from the mapping when the parser accepts bytes
+                with memoryview(mmapped_file) as view:
+                    json_data = self._parse_json_bytes(view)
+
+                if json_data is None:
+                    # Read content from memory-mapped file
+                    try:
+                        # Decode straight from the mapping without an intermediate bytes copy
+                        content = str(mmapped_file, "utf-8")
+                        logger.debug(
+                            f"Successfully read {len(content)} characters from memory-mapped {path}"
+                        )
+                    except UnicodeDecodeError as e:
+                        raise FileAccessError(
+                            f"Unable to decode memory-mapped file '{path}' as UTF-8: {e}",
+                            str(path),
+                            "mmap_decode",
+                            context={"encoding": "utf-8", "original_error": str(e)},
+                            cause=e,
+                        ) from e
+
+                    if self.progress_callback:
+                        self.progress_callback(0.6)
+
+                    # Parse JSON
+                    json_data = self._parse_json(content)
 
                 if self.progress_callback:
                     self.progress_callback(0.8)
@@ -338,26 +434,16 @@ class DoclingJsonReader(BaseReader):
             if self.progress_callback:
                 self.progress_callback(0.1)
 
-            # Use buffered I/O for large files
-            with Path(path).open(encoding="utf-8", buffering=JSON_PARSER_BUFFER_SIZE) as f:
-
+            # Use buffered binary I/O for large files and decode the blob once,
+            # skipping the text layer's chunked decoding and newline translation
+            with path.open("rb", buffering=JSON_PARSER_BUFFER_SIZE) as f:
                 if self.progress_callback:
                     self.progress_callback(0.3)
 
                 # Read entire content with buffered I/O
                 try:
-                    content = f.read()
-                    logger.debug(
-                        f"Successfully read {len(content)} characters with streaming from {path}"
-                    )
-                except UnicodeDecodeError as e:
-                    raise FileAccessError(
-                        f"Unable to decode streaming file '{path}' as UTF-8: {e}",
-                        str(path),
-                        "streaming_decode",
-                        context={"encoding": "utf-8", "original_error": str(e)},
-                        cause=e,
-                    ) from e
+                    raw = f.read()
+                    logger.debug(f"Successfully read {len(raw)} bytes with streaming from {path}")
                 except OSError as e:
                     raise FileAccessError(
                         f"Error reading streaming file '{path}': {e}",
@@ -371,8 +457,20 @@ class DoclingJsonReader(BaseReader):
                 if self.progress_callback:
                     self.progress_callback(0.6)
 
-                # Use fast JSON parser for large content
-                json_data = self._parse_json_buffered(content)
+                # Use fast JSON parser for large content, on the raw bytes when possible
+                json_data = self._parse_json_bytes(raw)
+                if json_data is None:
+                    try:
+                        content = raw.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        raise FileAccessError(
+                            f"Unable to decode streaming file '{path}' as UTF-8: {e}",
+                            str(path),
+                            "streaming_decode",
+                            context={"encoding": "utf-8", "original_error": str(e)},
+                            cause=e,
+                        ) from e
+                    json_data = self._parse_json_buffered(content)
 
                 if self.progress_callback:
                     self.progress_callback(0.8)
@@ -389,6 +487,20 @@ class DoclingJsonReader(BaseReader):
             if self.progress_callback:
                 self.progress_callback(1.0)
 
+    def _parse_json_bytes(self, raw: bytes | memoryview) -> dict[str, Any] | None:
+        """Parse undecoded file content when the selected parser accepts bytes.
+
+        Returns None when the parser needs str or the content does not parse,
+        so callers fall back to decoding and parsing as usual and report
+        encoding and syntax errors exactly as before.
+        """
+        if not self._parses_bytes:
+            return None
+        try:
+            return self._json_parser.loads(raw)
+        except ValueError:
+            return None
+
     def _parse_json(self, content: str) -> dict[str, Any]:
         """Parse JSON content with the selected parser."""
         parser_name = getattr(self._json_parser, "__name__", type(self._json_parser).__name__)
@@ -503,17 +615,9 @@ class DoclingJsonReader(BaseReader):
         try:
             import orjson
 
+            # orjson.loads takes str or bytes, so it is used as-is
             logger.debug("Using orjson for JSON parsing")
-
-            # Create wrapper for orjson to match standard interface
-            class OrjsonWrapper:
-                __name__ = "orjson"
-
-                @staticmethod
-                def loads(s: str) -> Any:
-                    return orjson.loads(s.encode("utf-8"))
-
-            return OrjsonWrapper()
+            return orjson
         except ImportError:
             pass
 
@@ -536,18 +640,19 @@ class DoclingJsonReader(BaseReader):
         logger.debug("No fast JSON library available, using standard library")
         return json
 
-    def _get_cache_key(self, path: Path) -> tuple:
-        """Generate cache key based on file path, size, and modification time.
+    def _get_cache_key(self, path: Path, stat: os.stat_result | None = None) -> tuple:
+        """Generate cache key based on file path, inode, size, and modification time.
+
+        Args:
+            path: File path
+            stat: Stat result for path, if the caller already has one
 
         Raises:
             OSError: If file stat information cannot be accessed due to permissions
         """
-        try:
+        if stat is None:
             stat = path.stat()
-            return (str(path.absolute()), stat.st_size, stat.st_mtime)
-        except OSError:
-            # Re-raise OSError to be handled by caller
-            raise
+        return (str(path.absolute()), stat.st_ino, stat.st_size, stat.st_mtime_ns)
 
     def clear_cache(self) -> None:
         """Clear the document cache."""
@@ -581,35 +686,65 @@ class DoclingJsonReader(BaseReader):
         try:
             path = Path(file_path)
 
-            # Check if file exists
-            if not path.exists():
-                logger.debug(f"File does not exist: {file_path}")
-                return False
-
-            # Check file extension first (fastest check)
+            # Reject by extension before touching the filesystem; most probes
+            # of other formats end here without a stat() call
             suffix = path.suffix.lower()
             if suffix not in self.SUPPORTED_EXTENSIONS:
-                logger.debug(f"Unsupported extension {suffix} for {file_path}")
+                logger.debug(f"Unsupported extension {suffix} for {path}")
                 return False
 
-            # For .docling.json files, assume they are valid
-            if path.name.endswith(".docling.json"):
-                logger.debug(f"Detected .docling.json format for {file_path}")
-                return True
-
-            # For generic .json files, do optimized content-based detection
-            if suffix == ".json":
-                result = self._check_docling_json_content_optimized(path)
-                logger.debug(f"Content-based format detection for {file_path}: {result}")
-                return result
+            # Check if file exists
+            if not path.exists():
+                logger.debug(f"File does not exist: {file_path}")
+                return False
 
-            return False
+            return self._matches_content(path, suffix)
 
         except Exception as e:
             # Log error but don't raise - format detection should be non-destructive
             logger.warning(f"Error during format detection for {file_path}: {e}")
             return False
 
+    def _matches_format(self, path: Path) -> bool:
+        """Check extension and content of a file already known to exist.
+
+        Args:
+            path: Path to an existing file
+
+        Returns:
+            bool: True if the file looks like DoclingDocument JSON
+        """
+        # Check file extension first (fastest check)
+        suffix = path.suffix.lower()
+        if suffix not in self.SUPPORTED_EXTENSIONS:
+            logger.debug(f"Unsupported extension {suffix} for {path}")
+            return False
+
+        return self._matches_content(path, suffix)
+
+    def _matches_content(self, path: Path, suffix: str) -> bool:
+        """Check name and content of an existing file with a supported suffix.
+
+        Args:
+            path: Path to an existing file
+            suffix: The file's lowercased suffix, already computed by the caller
+
+        Returns:
+            bool: True if the file looks like DoclingDocument JSON
+        """
+        # For .docling.json files, assume they are valid
+        if path.name.endswith(".docling.json"):
+            logger.debug(f"Detected .docling.json format for {path}")
+            return True
+
+        # For generic .json files, do optimized content-based detection
+        if suffix == ".json":
+            result = self._check_docling_json_content_optimized(path)
+            logger.debug(f"Content-based format detection for {path}: {result}")
+            return result
+
+        return False
+
     def _check_docling_json_content_optimized(self, path: Path) -> bool:
         """Optimized content checking for DoclingDocument markers.
 
@@ -621,17 +756,16 @@ class DoclingJsonReader(BaseReader):
         """
         try:
             # Read only the first chunk to check for markers (optimized)
-            with Path(path).open(encoding="utf-8") as f:
-                chunk = f.read(1024)  # Read first 1KB only
+            chunk = self._read_file_head(path)  # First 1KB, shared with other readers
 
-            # Quick string search for DoclingDocument markers
-            has_markers = (
-                '"schema_name"' in chunk and '"DoclingDocument"' in chunk and '"version"' in chunk
-            )
+            # The markers are ASCII, so search the raw bytes without decoding
+            has_markers = all(
+                marker in chunk for marker in DOCLING_CONTENT_MARKERS
+            ) and self._is_utf8_head(chunk)
             logger.debug(f"DoclingDocument content markers found in {path}: {has_markers}")
             return has_markers
 
-        except (OSError, UnicodeDecodeError) as e:
+        except OSError as e:
             logger.debug(f"Error reading content from {path} for format detection: {e}")
             return False
 
@@ -658,7 +792,7 @@ class DoclingJsonReader(BaseReader):
             )
 
         # Check for required schema fields
-        missing_fields = self.REQUIRED_SCHEMA_FIELDS - set(json_data.keys())
+        missing_fields = self.REQUIRED_SCHEMA_FIELDS.difference(json_data)
         if missing_fields:
             raise ValueError(
                 f"Invalid DoclingDocument schema in '{file_path}': "
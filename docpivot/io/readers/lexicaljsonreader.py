@@ -1,5 +1,6 @@
 """LexicalJsonReader for loading Lexical JSON files into DoclingDocument objects."""
 
+import mmap
 import time
 from pathlib import Path
 from typing import Any
@@ -23,6 +24,23 @@ from .exceptions import (
 
 logger = get_logger(__name__)
 
+# orjson parses UTF-8 bytes directly (validating the encoding as it goes),
+# so file content need not be decoded to str first
+try:
+    import orjson
+
+    _bytes_json_loads = orjson.loads
+except ImportError:
+    _bytes_json_loads = None
+
+FORMAT_DETECTION_BYTES = 512
+
+# Files at least this large are decoded straight out of a memory map
+MMAP_THRESHOLD_BYTES = 1024 * 1024  # 1MB
+
+# Byte markers that identify Lexical JSON near the start of a file
+LEXICAL_CONTENT_MARKERS = (b'"root"', b'"children"', b'"type"')
+
 
 class LexicalJsonReader(BaseReader):
     """Reader for Lexical JSON files that loads them into DoclingDocument objects.
@@ -51,14 +69,14 @@ class LexicalJsonReader(BaseReader):
             UnsupportedFormatError: If the file format is not supported
             TransformationError: If conversion to DoclingDocument fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         file_path_str = str(file_path)
         logger.info(f"Loading Lexical JSON from {file_path_str}")
 
         try:
             # Validate file exists and is readable
             try:
-                path = self._validate_file_exists(file_path)
+                path, file_stat = self._stat_existing_file(file_path)
             except FileNotFoundError as e:
                 raise FileAccessError(
                     f"File not found: {file_path}",
@@ -77,19 +95,22 @@ class LexicalJsonReader(BaseReader):
                 ) from e
 
             # Log file size for performance monitoring
-            file_size = path.stat().st_size
+            file_size = file_stat.st_size
             logger.debug(f"File size: {file_size} bytes")
 
-            # Check format detection
-            if not self.detect_format(file_path):
+            # Check format detection (existence was validated above)
+            if not self._matches_format(path):
                 raise UnsupportedFormatError(file_path_str)
 
-            # Read file content with comprehensive error handling
+            # Parse straight from the raw bytes when possible; otherwise read and
+            # decode once, bypassing the text I/O layer
             try:
-                json_content = path.read_text(encoding="utf-8")
-                logger.debug(
-                    f"Successfully read {len(json_content)} characters from {file_path_str}"
-                )
+                json_data = self._parse_json_file(path, file_size)
+                if json_data is None:
+                    json_content = self._read_json_text(path, file_size)
+                    logger.debug(
+                        f"Successfully read {len(json_content)} characters from {file_path_str}"
+                    )
             except UnicodeDecodeError as e:
                 raise FileAccessError(
                     f"Unable to decode file '{file_path_str}' as UTF-8. "
@@ -111,7 +132,8 @@ class LexicalJsonReader(BaseReader):
                 ) from e
 
             # Parse and validate JSON content
-            json_data = validate_json_content(json_content, file_path_str)
+            if json_data is None:
+                json_data = validate_json_content(json_content, file_path_str)
 
             # Validate Lexical JSON structure using comprehensive validator
             validate_lexical_json(json_data, file_path_str)
@@ -121,7 +143,7 @@ class LexicalJsonReader(BaseReader):
                 document = self._convert_lexical_to_docling(json_data, file_path_str)
 
                 # Log successful completion
-                duration = (time.time() - start_time) * 1000
+                duration = (time.perf_counter() - start_time) * 1000
                 logger.info(
                     f"Successfully loaded Lexical JSON from {file_path_str} in {duration:.2f}ms"
                 )
@@ -150,12 +172,12 @@ class LexicalJsonReader(BaseReader):
             TransformationError,
         ):
             # Re-raise our custom exceptions without wrapping
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             logger.error(f"Failed to load Lexical JSON from {file_path_str} after {duration:.2f}ms")
             raise
         except Exception as e:
             # Handle unexpected errors with comprehensive context
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter() - start_time) * 1000
             context = {
                 "file_path": file_path_str,
                 "operation": "load_data",
@@ -171,6 +193,69 @@ class LexicalJsonReader(BaseReader):
                 cause=e,
             ) from e
 
+    def _parse_json_file(self, path: Path, file_size: int) -> Any | None:
+        """Parse a JSON file from its undecoded bytes when orjson is available.
+
+        Large files are parsed straight from a read-only memory map. Returns
+        None when orjson is not installed or the content does not parse, so
+        the caller falls back to decoding and validating as usual and reports
+        encoding and syntax errors exactly as before.
+
+        Args:
+            path: Path to the file
+            file_size: Size of the file in bytes
+
+        Returns:
+            Any | None: Parsed JSON data, or None to fall back
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        if _bytes_json_loads is None:
+            return None
+
+        try:
+            if file_size < MMAP_THRESHOLD_BYTES:
+                return _bytes_json_loads(path.read_bytes())
+
+            with (
+                path.open("rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                self._advise_sequential(mapped)
+                with memoryview(mapped) as view:
+                    return _bytes_json_loads(view)
+        except ValueError:
+            return None
+
+    def _read_json_text(self, path: Path, file_size: int) -> str:
+        """Read and decode a JSON file as UTF-8.
+
+        Large files are decoded directly from a read-only memory map, so the
+        raw bytes are never copied onto the Python heap next to the decoded
+        string.
+
+        Args:
+            path: Path to the file
+            file_size: Size of the file in bytes
+
+        Returns:
+            str: Decoded file content
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
+            OSError: If the file cannot be read
+        """
+        if file_size < MMAP_THRESHOLD_BYTES:
+            return path.read_bytes().decode("utf-8")
+
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            self._advise_sequential(mapped)
+            return str(mapped, "utf-8")
+
     def detect_format(self, file_path: str | Path) -> bool:
         """Detect if this reader can handle the given file format.
 
@@ -185,15 +270,43 @@ class LexicalJsonReader(BaseReader):
         """
         path = Path(file_path)
 
+        # Reject by extension before touching the filesystem
+        suffix = path.suffix.lower()
+        if suffix not in self.SUPPORTED_EXTENSIONS:
+            return False
+
         # Check if file exists
         if not path.exists():
             return False
 
+        return self._matches_content(path, suffix)
+
+    def _matches_format(self, path: Path) -> bool:
+        """Check extension and content of a file already known to exist.
+
+        Args:
+            path: Path to an existing file
+
+        Returns:
+            bool: True if the file looks like Lexical JSON
+        """
         # Check file extension
         suffix = path.suffix.lower()
         if suffix not in self.SUPPORTED_EXTENSIONS:
             return False
 
+        return self._matches_content(path, suffix)
+
+    def _matches_content(self, path: Path, suffix: str) -> bool:
+        """Check name and content of an existing file with a supported suffix.
+
+        Args:
+            path: Path to an existing file
+            suffix: The file's lowercased suffix, already computed by the caller
+
+        Returns:
+            bool: True if the file looks like Lexical JSON
+        """
         # For .lexical.json files, we assume they are valid
         if path.name.endswith(".lexical.json"):
             return True
@@ -215,14 +328,15 @@ class LexicalJsonReader(BaseReader):
         """
         try:
             # Read and parse a small portion to check schema
-            with path.open("r", encoding="utf-8") as f:
-                # Read first chunk to check for Lexical markers
-                chunk = f.read(512)
+            # Read first chunk to check for Lexical markers
+            chunk = self._read_file_head(path)[:FORMAT_DETECTION_BYTES]
 
-            # Quick check for Lexical JSON markers
-            return '"root"' in chunk and '"children"' in chunk and '"type"' in chunk
+            # The markers are ASCII, so search the raw bytes without decoding
+            return all(
+                marker in chunk for marker in LEXICAL_CONTENT_MARKERS
+            ) and self._is_utf8_head(chunk)
 
-        except (OSError, UnicodeDecodeError):
+        except OSError:
             return False
 
     def _validate_lexical_schema(self, json_data: dict[str, Any], file_path: str) -> None:
@@ -242,7 +356,7 @@ class LexicalJsonReader(BaseReader):
             )
 
         # Check for required root fields
-        missing_fields = self.REQUIRED_ROOT_FIELDS - set(json_data.keys())
+        missing_fields = self.REQUIRED_ROOT_FIELDS.difference(json_data)
         if missing_fields:
             raise ValueError(
                 f"Invalid Lexical JSON schema in '{file_path}': "
@@ -258,7 +372,7 @@ class LexicalJsonReader(BaseReader):
             )
 
         # Check required root child fields
-        missing_root_fields = self.REQUIRED_ROOT_CHILD_FIELDS - set(root.keys())
+        missing_root_fields = self.REQUIRED_ROOT_CHILD_FIELDS.difference(root)
         if missing_root_fields:
             raise ValueError(
                 f"Invalid Lexical JSON schema in '{file_path}': "
@@ -278,15 +392,18 @@ class LexicalJsonReader(BaseReader):
         Returns:
             DoclingDocument: Converted document
         """
+        # Parse the path once for both name fields
+        source = Path(file_path)
+
         # Initialize document structure
         doc_data = {
             "schema_name": "DoclingDocument",
             "version": "1.4.0",
-            "name": Path(file_path).stem,
+            "name": source.stem,
             "origin": {
                 "mimetype": "application/json",
                 "binary_hash": abs(hash(str(lexical_data))),
-                "filename": Path(file_path).name,
+                "filename": source.name,
             },
             "furniture": {
                 "self_ref": "#/furniture",
@@ -327,17 +444,17 @@ class LexicalJsonReader(BaseReader):
             nodes: List of Lexical nodes to process
             doc_data: Document data structure being built
         """
+        # Bind handlers once so each node costs one dict lookup, not a compare chain
+        handlers = {
+            "heading": self._process_heading_node,
+            "paragraph": self._process_paragraph_node,
+            "list": self._process_list_node,
+            "table": self._process_table_node,
+        }
         for node in nodes:
-            node_type = node.get("type", "")
-
-            if node_type == "heading":
-                self._process_heading_node(node, doc_data)
-            elif node_type == "paragraph":
-                self._process_paragraph_node(node, doc_data)
-            elif node_type == "list":
-                self._process_list_node(node, doc_data)
-            elif node_type == "table":
-                self._process_table_node(node, doc_data)
+            handler = handlers.get(node.get("type", ""))
+            if handler is not None:
+                handler(node, doc_data)
 
     def _process_heading_node(self, node: dict[str, Any], doc_data: dict[str, Any]) -> None:
         """Process a Lexical heading node into Docling SectionHeaderItem.
@@ -354,9 +471,10 @@ class LexicalJsonReader(BaseReader):
         level = int(tag[1]) if tag.startswith("h") and tag[1:].isdigit() else 1
 
         # Create SectionHeaderItem
-        text_index = len(doc_data["texts"])
+        # Format the reference once; the body entry points at the same string
+        self_ref = f"#/texts/{len(doc_data['texts'])}"
         text_item = {
-            "self_ref": f"#/texts/{text_index}",
+            "self_ref": self_ref,
             "parent": {"$ref": "#/body"},
             "children": [],
             "content_layer": "body",
@@ -370,7 +488,7 @@ class LexicalJsonReader(BaseReader):
         # Add to texts array and reference in body
         doc_data["texts"].append(text_item)
 
-        doc_data["body"]["children"].append({"$ref": f"#/texts/{text_index}"})
+        doc_data["body"]["children"].append({"$ref": self_ref})
 
     def _process_paragraph_node(self, node: dict[str, Any], doc_data: dict[str, Any]) -> None:
         """Process a Lexical paragraph node into Docling TextItem.
@@ -383,9 +501,10 @@ class LexicalJsonReader(BaseReader):
         text_content = self._extract_text_from_children(node.get("children", []))
 
         # Create TextItem
-        text_index = len(doc_data["texts"])
+        # Format the reference once; the body entry points at the same string
+        self_ref = f"#/texts/{len(doc_data['texts'])}"
         text_item = {
-            "self_ref": f"#/texts/{text_index}",
+            "self_ref": self_ref,
             "parent": {"$ref": "#/body"},
             "children": [],
             "content_layer": "body",
@@ -398,7 +517,7 @@ class LexicalJsonReader(BaseReader):
         # Add to texts array and reference in body
         doc_data["texts"].append(text_item)
 
-        doc_data["body"]["children"].append({"$ref": f"#/texts/{text_index}"})
+        doc_data["body"]["children"].append({"$ref": self_ref})
 
     def _process_list_node(self, node: dict[str, Any], doc_data: dict[str, Any]) -> None:
         """Process a Lexical list node into Docling GroupItem.
@@ -410,41 +529,47 @@ class LexicalJsonReader(BaseReader):
         list_type = node.get("listType", "unordered")
         list_items = node.get("children", [])
 
-        # Create text items for each list item
-        group_children: list[dict[str, str]] = []
+        # Create text items for each list item, then add them in one batch
+        texts = doc_data["texts"]
+        base_index = len(texts)
+        # Shared by every item's parent ref and the group's own references
+        parent_ref = f"#/groups/{len(doc_data['groups'])}"
+        ordered = list_type == "ordered"
+
+        new_items: list[dict[str, Any]] = []
         for item in list_items:
             if item.get("type") == "listitem":
                 text_content = self._extract_text_from_children(item.get("children", []))
 
                 # Add list marker based on type
-                if list_type == "ordered":
-                    marker_text = f"{len(group_children) + 1}. {text_content}"
+                if ordered:
+                    marker_text = f"{len(new_items) + 1}. {text_content}"
                 else:
                     marker_text = f"● {text_content}"
 
                 # Create TextItem
-                text_index = len(doc_data["texts"])
-                text_item = {
-                    "self_ref": f"#/texts/{text_index}",
-                    "parent": {"$ref": f"#/groups/{len(doc_data['groups'])}"},
-                    "children": [],
-                    "content_layer": "body",
-                    "label": "text",
-                    "text": marker_text,
-                    "orig": marker_text,
-                    "prov": [],
-                }
-
-                # Add to texts array
-                doc_data["texts"].append(text_item)
-
-                group_children.append({"$ref": f"#/texts/{text_index}"})
+                new_items.append(
+                    {
+                        "self_ref": f"#/texts/{base_index + len(new_items)}",
+                        "parent": {"$ref": parent_ref},
+                        "children": [],
+                        "content_layer": "body",
+                        "label": "text",
+                        "text": marker_text,
+                        "orig": marker_text,
+                        "prov": [],
+                    }
+                )
+
+        # Add to texts array
+        texts.extend(new_items)
+        group_children = [{"$ref": text_item["self_ref"]} for text_item in new_items]
 
         # Create GroupItem
         if group_children:
             group_index = len(doc_data["groups"])
             group_item = {
-                "self_ref": f"#/groups/{group_index}",
+                "self_ref": parent_ref,
                 "parent": {"$ref": "#/body"},
                 "children": group_children,
                 "content_layer": "body",
@@ -455,7 +580,7 @@ class LexicalJsonReader(BaseReader):
             # Add to groups array and reference in body
             doc_data["groups"].append(group_item)
 
-            doc_data["body"]["children"].append({"$ref": f"#/groups/{group_index}"})
+            doc_data["body"]["children"].append({"$ref": parent_ref})
 
     def _process_table_node(self, node: dict[str, Any], doc_data: dict[str, Any]) -> None:
         """Process a Lexical table node into Docling TableItem.
@@ -470,27 +595,24 @@ class LexicalJsonReader(BaseReader):
         grid_data = []
         for row in rows:
             if row.get("type") == "tablerow":
-                grid_row = []
-                for cell in row.get("children", []):
-                    if cell.get("type") == "tablecell":
-                        cell_text = self._extract_text_from_children(cell.get("children", []))
-                        is_header = cell.get("headerState", 0) == 1
-
-                        grid_cell = {
-                            "text": cell_text,
-                            "column_header": is_header,
-                            "prov": [],
-                        }
-                        grid_row.append(grid_cell)
+                grid_row = [
+                    {
+                        "text": self._extract_text_from_children(cell.get("children", [])),
+                        "column_header": cell.get("headerState", 0) == 1,
+                        "prov": [],
+                    }
+                    for cell in row.get("children", [])
+                    if cell.get("type") == "tablecell"
+                ]
 
                 if grid_row:
                     grid_data.append(grid_row)
 
         # Create TableItem
         if grid_data:
-            table_index = len(doc_data["tables"])
+            self_ref = f"#/tables/{len(doc_data['tables'])}"
             table_item = {
-                "self_ref": f"#/tables/{table_index}",
+                "self_ref": self_ref,
                 "parent": {"$ref": "#/body"},
                 "children": [],
                 "content_layer": "body",
@@ -502,7 +624,7 @@ class LexicalJsonReader(BaseReader):
             # Add to tables array and reference in body
             doc_data["tables"].append(table_item)
 
-            doc_data["body"]["children"].append({"$ref": f"#/tables/{table_index}"})
+            doc_data["body"]["children"].append({"$ref": self_ref})
 
     def _extract_text_from_children(self, children: list[dict[str, Any]]) -> str:
         """Extract text content from Lexical node children.
@@ -513,8 +635,4 @@ class LexicalJsonReader(BaseReader):
         Returns:
             str: Combined text content
         """
-        text_parts = []
-        for child in children:
-            if child.get("type") == "text":
-                text_parts.append(child.get("text", ""))
-        return "".join(text_parts)
+        return "".join(child.get("text", "") for child in children if child.get("type") == "text")
@@ -23,6 +23,8 @@ class ReaderFactory:
             enable_registry_integration: Whether to integrate with the format registry
         """
         self._readers: dict[str, type[BaseReader]] = {}
+        # Default-constructed reader per format, reused for format detection
+        self._probe_readers: dict[str, BaseReader] = {}
         self._registry_integration_enabled = enable_registry_integration
         self._register_default_readers()
 
@@ -45,6 +47,7 @@ class ReaderFactory:
             raise ValueError(f"Reader class {reader_class.__name__} must extend BaseReader")
 
         self._readers[format_name] = reader_class
+        self._probe_readers.pop(format_name, None)
 
     def get_reader(self, file_path: str | Path, **kwargs) -> BaseReader:
         """Automatically select and instantiate the appropriate reader for file.
@@ -116,9 +119,11 @@ class ReaderFactory:
         # Try each registered reader's detect_format method
         for format_name, reader_class in self._readers.items():
             try:
-                # Create a temporary instance to test format detection
-                temp_reader = reader_class()
-                if temp_reader.detect_format(file_path):
+                # Reuse one instance per format to test format detection
+                probe_reader = self._probe_readers.get(format_name)
+                if probe_reader is None:
+                    probe_reader = self._probe_readers[format_name] = reader_class()
+                if probe_reader.detect_format(file_path):
                     return format_name
             except Exception:
                 # If a reader fails during detection, skip it
@@ -5,12 +5,70 @@ that extend DocPivot's functionality to support additional output formats.
 """
 
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 from docling_core.transforms.serializer.base import SerializationResult
 from docling_core.transforms.serializer.common import BaseDocSerializer
 from docling_core.types import DoclingDocument
 
+# Scalar item attributes copied by _item_to_dict when present and truthy
+_ITEM_ATTRS = ("text", "label")
+
+ItemConverter = Callable[[Any, Callable[[Any], dict[str, Any]]], dict[str, Any]]
+
+# Per-class converters built on first sight of each document item class
+_class_converters: dict[type, ItemConverter] = {}
+
+
+def _convert_unknown_item(item: Any, to_dict: Callable[[Any], dict[str, Any]]) -> dict[str, Any]:
+    """Convert an item whose attributes are not known up front."""
+    result = {}
+    for attr in _ITEM_ATTRS:
+        try:
+            value = getattr(item, attr)
+        except AttributeError:
+            continue
+        if value:
+            result[attr] = value
+
+    try:
+        children = item.children
+    except AttributeError:
+        children = None
+    if children:
+        result["children"] = [to_dict(child) for child in children]
+    return result
+
+
+def _build_item_converter(item_cls: type) -> ItemConverter:
+    """Build a converter specialized to the declared fields of an item class.
+
+    Pydantic item classes (all DoclingDocument node types) declare their
+    fields in ``model_fields``, so the converter only reads attributes the
+    class is known to have. Other classes fall back to probing each attribute.
+    """
+    fields = getattr(item_cls, "model_fields", None)
+    if not isinstance(fields, dict):
+        return _convert_unknown_item
+
+    attrs = tuple(attr for attr in _ITEM_ATTRS if attr in fields)
+    has_children = "children" in fields
+
+    def convert(item: Any, to_dict: Callable[[Any], dict[str, Any]]) -> dict[str, Any]:
+        result = {}
+        for attr in attrs:
+            value = getattr(item, attr)
+            if value:
+                result[attr] = value
+        if has_children:
+            children = item.children
+            if children:
+                result["children"] = [to_dict(child) for child in children]
+        return result
+
+    return convert
+
 
 class CustomSerializerParams:
     """Base class for custom serializer parameters.
@@ -223,16 +281,24 @@ class CustomSerializerBase(BaseDocSerializer):
 
         # Extract text from document body
         # This is a simple implementation - subclasses may need more sophisticated parsing
+        # Walk the tree with an explicit stack (children pushed in reverse to
+        # keep document order) so deep documents do not recurse per node
         text_parts = []
+        stack = [self.doc.body]
+        while stack:
+            item = stack.pop()
+            try:
+                text = item.text
+            except AttributeError:
+                text = None
+            if text:
+                text_parts.append(text)
+            try:
+                children = item.children
+            except AttributeError:
+                continue
+            stack.extend(reversed(children))
 
-        def extract_text(item):
-            if hasattr(item, "text") and item.text:
-                text_parts.append(item.text)
-            if hasattr(item, "children"):
-                for child in item.children:
-                    extract_text(child)
-
-        extract_text(self.doc.body)
         return "\n".join(text_parts)
 
     def _serialize_with_structure(self) -> dict[str, Any]:
@@ -245,21 +311,22 @@ class CustomSerializerBase(BaseDocSerializer):
         Returns:
             Dict[str, Any]: Structured representation of the document
         """
+        doc = self.doc
         result = {
             "metadata": {
-                "name": getattr(self.doc, "name", ""),
-                "origin": getattr(self.doc, "origin", {}),
+                "name": getattr(doc, "name", ""),
+                "origin": getattr(doc, "origin", {}),
             },
             "content": {},
         }
 
-        if hasattr(self.doc, "body") and self.doc.body:
-            result["content"]["body"] = self._item_to_dict(self.doc.body)
+        body = getattr(doc, "body", None)
+        if body:
+            result["content"]["body"] = self._item_to_dict(body)
 
-        if hasattr(self.doc, "furniture"):
-            result["content"]["furniture"] = [
-                self._item_to_dict(item) for item in self.doc.furniture
-            ]
+        furniture = getattr(doc, "furniture", None)
+        if furniture is not None:
+            result["content"]["furniture"] = [self._item_to_dict(item) for item in furniture]
 
         return result
 
@@ -272,18 +339,14 @@ class CustomSerializerBase(BaseDocSerializer):
         Returns:
             Dict[str, Any]: Dictionary representation of the item
         """
-        result = {}
-
-        if hasattr(item, "text") and item.text:
-            result["text"] = item.text
-
-        if hasattr(item, "label") and item.label:
-            result["label"] = item.label
-
-        if hasattr(item, "children") and item.children:
-            result["children"] = [self._item_to_dict(child) for child in item.children]
-
-        return result
+        item_cls = item.__class__
+        try:
+            converter = _class_converters[item_cls]
+        except KeyError:
+            converter = _build_item_converter(item_cls)
+            if converter is not _convert_unknown_item:
+                _class_converters[item_cls] = converter
+        return converter(item, self._item_to_dict)
 
     def _apply_component_serializers(self, content: str) -> str:
         """Apply component serializers to process specific elements.
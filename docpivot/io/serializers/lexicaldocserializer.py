@@ -2,11 +2,13 @@
 
 import gc
 import json
+import re
 import time
 from collections.abc import Generator
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Protocol
+from typing import IO, Any, Protocol
 
 from docling_core.transforms.serializer.base import SerializationResult
 from docling_core.transforms.serializer.common import BaseDocSerializer
@@ -57,8 +59,12 @@ DEFAULT_STYLE = ""
 LIST_MARKER_BULLET = "● "
 LIST_MARKER_BULLET_ALT = "• "
 LIST_MARKER_SEPARATOR = ". "
+LIST_BULLET_MARKERS = (LIST_MARKER_BULLET, LIST_MARKER_BULLET_ALT)
 JSON_INDENT_SIZE = 2
 
+# Oldest generation collected between batches in memory-efficient mode
+YOUNG_GC_GENERATION = 1
+
 # Lexical node types
 NODE_TYPE_ROOT = "root"
 NODE_TYPE_TEXT = "text"
@@ -95,6 +101,18 @@ FORMAT_ITALIC = 2
 FORMAT_UNDERLINE = 4
 FORMAT_STRIKETHROUGH = 8
 
+# Format name -> Lexical format bit, used to fold format lists into a bitmask
+FORMAT_FLAGS = {
+    "bold": FORMAT_BOLD,
+    "italic": FORMAT_ITALIC,
+    "underline": FORMAT_UNDERLINE,
+    "strikethrough": FORMAT_STRIKETHROUGH,
+}
+
+# Link detection patterns, compiled once at import
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+')
+SIMPLE_URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
+
 
 @dataclass
 class LexicalParams:
@@ -104,6 +122,7 @@ class LexicalParams:
         include_metadata: Whether to include document metadata in output
         preserve_formatting: Whether to preserve text formatting when available
         indent_json: Whether to indent JSON output for readability
+        json_indent: Spaces per indentation level when indent_json is set
         version: Lexical format version to use
         custom_root_attributes: Additional attributes to add to root node
         skip_validation: Whether to skip DoclingDocument validation (for testing)
@@ -124,6 +143,7 @@ class LexicalParams:
     include_metadata: bool = True
     preserve_formatting: bool = True
     indent_json: bool = True
+    json_indent: int = JSON_INDENT_SIZE
     version: int = LEXICAL_VERSION
     custom_root_attributes: dict[str, Any] | None = field(default_factory=dict)
     skip_validation: bool = False
@@ -239,6 +259,7 @@ class LexicalDocSerializer(BaseDocSerializer):
             # Handle invalid params gracefully - will be caught in validation
             self._json_encoder = json
             self._node_cache = None
+        self._metadata_cache: tuple[tuple[int, bool], dict[str, Any]] | None = None
         self._elements_processed = 0
         self._start_time = 0.0
 
@@ -288,26 +309,12 @@ class LexicalDocSerializer(BaseDocSerializer):
             TransformationError: If conversion to Lexical format fails
             ConfigurationError: If serializer parameters are invalid
         """
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
         logger.info("Serializing DoclingDocument to Lexical JSON format")
 
+        params = self.params
         try:
-            # Validate input document structure (skip if disabled for testing)
-            should_validate = True
-            try:
-                should_validate = not self.params.skip_validation
-            except AttributeError:
-                should_validate = True
-
-            if should_validate:
-                validate_docling_document(self.doc)
-                logger.debug("DoclingDocument validation passed")
-            else:
-                logger.debug("DoclingDocument validation skipped")
-
-            # Validate serializer parameters
-            self._validate_serializer_params()
-            logger.debug("Serializer parameters validation passed")
+            self._validate_inputs()
 
             # Determine processing strategy based on document size and configuration
             total_elements = self._count_total_elements()
@@ -319,8 +326,8 @@ class LexicalDocSerializer(BaseDocSerializer):
             )
 
             # Initialize progress tracking
-            if self.params.progress_callback:
-                self.params.progress_callback(0.0)
+            if params.progress_callback:
+                params.progress_callback(0.0)
 
             # Choose serialization strategy
             if use_streaming:
@@ -331,24 +338,24 @@ class LexicalDocSerializer(BaseDocSerializer):
                 json_text = self._serialize_standard()
 
             # Performance metrics removed - simplified implementation
-            duration = (time.time() - self._start_time) * 1000
+            duration = (time.perf_counter() - self._start_time) * 1000
 
             logger.info(f"Lexical serialization complete: {duration:.2f}ms, {len(json_text)} chars")
 
             # Final progress update
-            if self.params.progress_callback:
-                self.params.progress_callback(1.0)
+            if params.progress_callback:
+                params.progress_callback(1.0)
 
             return SerializationResult(text=json_text)
 
         except (ValidationError, TransformationError, ConfigurationError):
             # Re-raise custom exceptions
-            duration = (time.time() - self._start_time) * 1000
+            duration = (time.perf_counter() - self._start_time) * 1000
             logger.error(f"Lexical serialization failed after {duration:.2f}ms")
             raise
         except Exception as e:
             # Handle unexpected errors with comprehensive contex
-            duration = (time.time() - self._start_time) * 1000
+            duration = (time.perf_counter() - self._start_time) * 1000
             context = {
                 "operation": "serialize",
                 "duration_ms": duration,
@@ -363,6 +370,101 @@ class LexicalDocSerializer(BaseDocSerializer):
                 cause=e,
             ) from e
 
+    def serialize_to_stream(self, stream: IO[str]) -> int:
+        """Serialize the DoclingDocument to Lexical JSON and write it to a stream.
+
+        Documents large enough to use streaming mode and serialized without
+        indentation are encoded ``batch_size`` body children at a time, so the
+        complete JSON text is never held in memory. All other documents are
+        written in one piece from ``serialize()``.
+
+        Args:
+            stream: Text stream to write the Lexical JSON to
+
+        Returns:
+            int: Number of characters written
+
+        Raises:
+            ValidationError: If the document structure is invalid
+            TransformationError: If conversion to Lexical format fails
+            ConfigurationError: If serializer parameters are invalid
+
+        Note:
+            In batched mode output is written as it is produced, so if an
+            error is raised part way through, the stream may already hold
+            partial, invalid JSON.
+        """
+        params = self.params
+        if params.indent_json:
+            return stream.write(self.serialize().text)
+
+        self._start_time = time.perf_counter()
+        self._validate_inputs()
+        if not self._should_use_streaming(self._count_total_elements()):
+            return stream.write(self.serialize().text)
+
+        logger.info("Streaming DoclingDocument to Lexical JSON in batches")
+        if params.progress_callback:
+            params.progress_callback(0.0)
+
+        try:
+            # Encode the document around its body children: everything up to
+            # the opening "[" of root.children, then the batches, then the rest
+            # of the root node and any top-level keys such as "metadata".
+            separator = ", " if self._json_encoder is json else ","
+            structure = self._build_final_structure([])
+            root = structure.pop("root")
+            del root["children"]
+
+            prefix = self._encode_json({"root": {"children": []}})[: -len("]}}")]
+            suffix = "]" + (separator + self._encode_json(root)[1:] if root else "}")
+            suffix += separator + self._encode_json(structure)[1:] if structure else "}"
+
+            # Encode each batch as the generator produces it, with no re-buffering
+            written = stream.write(prefix)
+            wrote_nodes = False
+            for batch in self._iter_body_children_batches():
+                if wrote_nodes:
+                    written += stream.write(separator)
+                written += stream.write(self._encode_json(batch)[1:-1])
+                wrote_nodes = True
+            written += stream.write(suffix)
+        except (ValidationError, TransformationError, ConfigurationError):
+            raise
+        except Exception as e:
+            raise TransformationError(
+                f"Streaming serialization to output stream failed: {e}",
+                transformation_type="streaming_lexical",
+                context={"elements_processed": self._elements_processed},
+                cause=e,
+            ) from e
+
+        if params.progress_callback:
+            params.progress_callback(1.0)
+
+        duration = (time.perf_counter() - self._start_time) * 1000
+        logger.info(f"Lexical stream serialization complete: {duration:.2f}ms, {written} chars")
+        return written
+
+    def _validate_inputs(self) -> None:
+        """Validate the document (unless skipped) and the serializer parameters."""
+        # Validate input document structure (skip if disabled for testing)
+        should_validate = True
+        try:
+            should_validate = not self.params.skip_validation
+        except AttributeError:
+            should_validate = True
+
+        if should_validate:
+            validate_docling_document(self.doc)
+            logger.debug("DoclingDocument validation passed")
+        else:
+            logger.debug("DoclingDocument validation skipped")
+
+        # Validate serializer parameters
+        self._validate_serializer_params()
+        logger.debug("Serializer parameters validation passed")
+
     def _should_use_streaming(self, total_elements: int) -> bool:
         """Determine if streaming mode should be used."""
         if self.params.enable_streaming is not None:
@@ -465,6 +567,17 @@ class LexicalDocSerializer(BaseDocSerializer):
                     context={f"provided_{param_name}": param_value},
                 )
 
+        # Validate indentation width; it only matters for indented output
+        json_indent = self.params.json_indent
+        if self.params.indent_json and (
+            not isinstance(json_indent, int) or isinstance(json_indent, bool) or json_indent < 0
+        ):
+            raise ConfigurationError(
+                f"Invalid json_indent: {self.params.json_indent}. "
+                f"Must be a non-negative integer.",
+                invalid_parameters=["json_indent"],
+            )
+
         # Validate batch size
         if self.params.batch_size <= 0:
             raise ConfigurationError(
@@ -517,21 +630,17 @@ class LexicalDocSerializer(BaseDocSerializer):
         """Transform DoclingDocument to Lexical JSON structure using parallel."""
         logger.debug("Starting parallel DoclingDocument to Lexical transformation")
         try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+            from concurrent.futures import ThreadPoolExecutor
 
             # Split body children into chunks
             chunks = self._split_body_children_into_chunks()
 
-            # Process chunks in parallel
+            # Process chunks in parallel; map yields chunk results in document
+            # order, which are flattened straight into the children list
             with ThreadPoolExecutor(max_workers=self.params.max_workers) as executor:
-                futures = [
-                    executor.submit(self._process_body_children_chunk, chunk) for chunk in chunks
-                ]
-
-                lexical_children = []
-                for future in as_completed(futures):
-                    chunk_result = future.result()
-                    lexical_children.extend(chunk_result)
+                lexical_children = list(
+                    chain.from_iterable(executor.map(self._process_body_children_chunk, chunks))
+                )
 
             # Update progress
             if self.params.progress_callback:
@@ -598,6 +707,8 @@ class LexicalDocSerializer(BaseDocSerializer):
 
     def _build_final_structure(self, lexical_children: list[dict[str, Any]]) -> dict[str, Any]:
         """Build final Lexical structure with metadata."""
+        params = self.params
+
         # Create the root Lexical structure
         root_node = {
             "children": lexical_children,
@@ -605,66 +716,82 @@ class LexicalDocSerializer(BaseDocSerializer):
             "format": DEFAULT_STYLE,
             "indent": DEFAULT_INDENT,
             "type": NODE_TYPE_ROOT,
-            "version": self.params.version,
+            "version": params.version,
         }
 
         # Add custom root attributes if provided
-        if self.params.custom_root_attributes:
-            try:
-                root_node.update(self.params.custom_root_attributes)
-                logger.debug(
-                    f"Added {len(self.params.custom_root_attributes)} custom root attributes"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Failed to add custom root attributes: {e}. Proceeding without them."
-                )
+        # (already checked to be a dict by _validate_serializer_params)
+        if params.custom_root_attributes:
+            root_node.update(params.custom_root_attributes)
+            logger.debug(f"Added {len(params.custom_root_attributes)} custom root attributes")
 
         lexical_data = {"root": root_node}
 
         # Include document metadata if requested
-        if self.params.include_metadata:
-            try:
-                metadata = {}
-                if hasattr(self.doc, "name") and self.doc.name:
-                    metadata.update(
-                        {
-                            "document_name": self.doc.name,
-                            "version": getattr(self.doc, "version", "1.0.0"),
-                        }
-                    )
-
-                # Handle origin object serialization
-                if hasattr(self.doc, "origin") and self.doc.origin:
-                    origin = self.doc.origin
-                    metadata["origin"] = {
-                        "mimetype": getattr(origin, "mimetype", ""),
-                        "filename": getattr(origin, "filename", ""),
-                        "binary_hash": getattr(origin, "binary_hash", 0),
-                        "uri": getattr(origin, "uri", None),
-                    }
-
-                if metadata:
-                    lexical_data["metadata"] = metadata
-                    logger.debug(f"Added metadata with {len(metadata)} fields")
-            except Exception as e:
-                logger.warning(
-                    f"Failed to include document metadata: {e}. Proceeding without metadata."
-                )
+        if params.include_metadata:
+            metadata = self._get_document_metadata()
+            if metadata:
+                lexical_data["metadata"] = metadata
+                logger.debug(f"Added metadata with {len(metadata)} fields")
 
         logger.debug("DoclingDocument to Lexical transformation completed successfully")
         return lexical_data
 
-    def _encode_json(self, data: dict[str, Any]) -> str:
+    def _get_document_metadata(self) -> dict[str, Any]:
+        """Return the document metadata block, building it once per document.
+
+        The block only depends on the document name and origin, so it is cached
+        and reused by subsequent ``serialize()`` calls. Call
+        ``invalidate_metadata_cache()`` after mutating ``self.doc`` in place.
+        """
+        cache_key = (id(self.doc), self.params.include_metadata)
+        if self._metadata_cache is not None and self._metadata_cache[0] == cache_key:
+            return self._metadata_cache[1]
+
+        doc = self.doc
+        metadata: dict[str, Any] = {}
+        try:
+            name = doc.name
+        except AttributeError:
+            name = None
+        if name:
+            metadata["document_name"] = name
+            metadata["version"] = getattr(doc, "version", "1.0.0")
+
+        # Handle origin object serialization
+        try:
+            origin = doc.origin
+        except AttributeError:
+            origin = None
+        if origin:
+            metadata["origin"] = {
+                "mimetype": getattr(origin, "mimetype", ""),
+                "filename": getattr(origin, "filename", ""),
+                "binary_hash": getattr(origin, "binary_hash", 0),
+                "uri": getattr(origin, "uri", None),
+            }
+
+        self._metadata_cache = (cache_key, metadata)
+        return metadata
+
+    def invalidate_metadata_cache(self) -> None:
+        """Discard the cached metadata block so it is rebuilt on next serialize."""
+        self._metadata_cache = None
+
+    def _encode_json(self, data: dict[str, Any] | list[Any]) -> str:
         """Encode data to JSON using selected encoder."""
         try:
+            indent_json = self.params.indent_json
+            json_indent = self.params.json_indent
             if self._json_encoder == json:
                 # Standard library json
-                indent = JSON_INDENT_SIZE if self.params.indent_json else None
+                indent = json_indent if indent_json else None
                 return json.dumps(data, indent=indent, ensure_ascii=False)
 
             if hasattr(self._json_encoder, "__name__") and self._json_encoder.__name__ == "orjson":
-                # orjson
+                # orjson only indents by two spaces; other widths use the stdlib below
+                if indent_json and json_indent != JSON_INDENT_SIZE:
+                    return json.dumps(data, indent=json_indent, ensure_ascii=False)
                 options = 0
                 if self.params.indent_json:
                     options |= self._json_encoder.OPT_INDENT_2
@@ -673,21 +800,21 @@ class LexicalDocSerializer(BaseDocSerializer):
             if hasattr(self._json_encoder, "dumps"):
                 # ujson and other libraries
                 try:
-                    if self.params.indent_json:
+                    if indent_json:
                         # Try with all parameters
                         return self._json_encoder.dumps(
-                            data, indent=JSON_INDENT_SIZE, ensure_ascii=False
+                            data, indent=json_indent, ensure_ascii=False
                         )
                     return self._json_encoder.dumps(data, ensure_ascii=False)
                 except TypeError:
                     # Fallback if ensure_ascii not supported
-                    if self.params.indent_json:
-                        return self._json_encoder.dumps(data, indent=JSON_INDENT_SIZE)
+                    if indent_json:
+                        return self._json_encoder.dumps(data, indent=json_indent)
                     return self._json_encoder.dumps(data)
 
             else:
                 # Ultimate fallback to standard json
-                indent = JSON_INDENT_SIZE if self.params.indent_json else None
+                indent = json_indent if indent_json else None
                 return json.dumps(data, indent=indent, ensure_ascii=False)
 
         except Exception as e:
@@ -699,105 +826,117 @@ class LexicalDocSerializer(BaseDocSerializer):
 
     def _process_body_children_streaming(self) -> Generator[dict[str, Any], None, None]:
         """Generator that yields processed body children in batches."""
-        batch = []
-        batch_count = 0
-
-        for i, child_ref in enumerate(self.doc.body.children):
-            try:
-                if not child_ref.cref:
-                    continue
-
-                lexical_node = self._process_single_child_ref_optimized(child_ref)
-                if lexical_node:
-                    batch.append(lexical_node)
-                    batch_count += 1
-                    self._elements_processed += 1
+        for batch in self._iter_body_children_batches():
+            yield from batch
 
-                # Process batch when full
-                if batch_count >= self.params.batch_size:
-                    for node in batch:
-                        yield node
-                    batch.clear()
-                    batch_count = 0
+    def _iter_body_children_batches(self) -> Generator[list[dict[str, Any]], None, None]:
+        """Generator that yields processed body children as lists of batch_size nodes.
 
-                    # Update progress
-                    if self.params.progress_callback:
-                        progress = min(0.7, i / len(self.doc.body.children) * 0.7)
-                        self.params.progress_callback(progress)
-
-                    # Force garbage collection for memory managemen
-                    if self.params.memory_efficient_mode:
-                        gc.collect()
-
-            except Exception as e:
-                logger.warning(f"Failed to process child ref {i}: {e}")
-                continue
+        Each yielded list is fresh, so consumers may keep or encode it directly.
+        """
+        children = self.doc.body.children
+        total_children = len(children)
+        batch_size = self.params.batch_size
+        progress_callback = self.params.progress_callback
+        memory_efficient = self.params.memory_efficient_mode
+        batch: list[dict[str, Any]] = []
+
+        for i, child_ref in enumerate(children):
+            lexical_node = self._process_child_ref_safely(i, child_ref)
+            if lexical_node:
+                batch.append(lexical_node)
+                self._elements_processed += 1
+
+            # Process batch when full
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+                # Update progress
+                if progress_callback:
+                    self._report_body_progress(progress_callback, i, total_children)
+
+                # Collect the young generations only: batch garbage lives there,
+                # and a full collection would re-traverse every retained node
+                if memory_efficient:
+                    gc.collect(YOUNG_GC_GENERATION)
 
         # Yield remaining items
-        for node in batch:
-            yield node
+        if batch:
+            yield batch
 
     def _split_body_children_into_chunks(self) -> list[list]:
         """Split body children into chunks for parallel processing."""
         children = self.doc.body.children
         chunk_size = max(1, len(children) // self.params.max_workers)
 
-        chunks = []
-        for i in range(0, len(children), chunk_size):
-            chunk = children[i : i + chunk_size]
-            chunks.append(chunk)
+        chunks = [children[i : i + chunk_size] for i in range(0, len(children), chunk_size)]
 
         logger.debug(f"Split {len(children)} children into {len(chunks)} chunks")
         return chunks
 
     def _process_body_children_chunk(self, children_chunk: list) -> list[dict[str, Any]]:
         """Process a chunk of body children."""
-        lexical_nodes = []
+        lexical_nodes: list[dict[str, Any]] = []
 
-        for child_ref in children_chunk:
-            try:
-                if not child_ref.cref:
-                    continue
-
-                lexical_node = self._process_single_child_ref_optimized(child_ref)
-                if lexical_node:
-                    lexical_nodes.append(lexical_node)
-                    self._elements_processed += 1
-
-            except Exception as e:
-                logger.warning(f"Failed to process child ref in chunk: {e}")
-                continue
+        for i, child_ref in enumerate(children_chunk):
+            lexical_node = self._process_child_ref_safely(i, child_ref)
+            if lexical_node:
+                lexical_nodes.append(lexical_node)
+                self._elements_processed += 1
 
         return lexical_nodes
 
     def _process_body_children_optimized(self) -> list[dict[str, Any]]:
         """Process body children with optimizations."""
-        lexical_nodes = []
-
-        for i, child_ref in enumerate(self.doc.body.children):
-            try:
-                if not child_ref.cref:
-                    continue
+        children = self.doc.body.children
+        total_children = len(children)
+        batch_size = self.params.batch_size
+        progress_callback = self.params.progress_callback
+        memory_efficient = self.params.memory_efficient_mode
+        lexical_nodes: list[dict[str, Any]] = []
+
+        for i, child_ref in enumerate(children):
+            lexical_node = self._process_child_ref_safely(i, child_ref)
+            if lexical_node:
+                lexical_nodes.append(lexical_node)
+                self._elements_processed += 1
+
+            # Update progress periodically
+            if progress_callback and i % 100 == 0:
+                self._report_body_progress(progress_callback, i, total_children)
+
+            # Memory management for large documents (young generations only)
+            if memory_efficient and i % batch_size == 0:
+                gc.collect(YOUNG_GC_GENERATION)
 
-                lexical_node = self._process_single_child_ref_optimized(child_ref)
-                if lexical_node:
-                    lexical_nodes.append(lexical_node)
-                    self._elements_processed += 1
+        return lexical_nodes
 
-                # Update progress periodically
-                if self.params.progress_callback and i % 100 == 0:
-                    progress = min(0.7, i / len(self.doc.body.children) * 0.7)
-                    self.params.progress_callback(progress)
+    @staticmethod
+    def _report_body_progress(progress_callback: Any, index: int, total_children: int) -> None:
+        """Report body-walk progress, logging rather than raising callback errors.
 
-                # Memory management for large documents
-                if self.params.memory_efficient_mode and i % self.params.batch_size == 0:
-                    gc.collect()
+        A failing callback is logged and the walk continues, as it always has,
+        so user callbacks cannot abort serialization part way through the body.
+        """
+        try:
+            progress_callback(min(0.7, index / total_children * 0.7))
+        except Exception as e:
+            logger.warning(f"Progress callback failed at child ref {index}: {e}")
 
-            except Exception as e:
-                logger.warning(f"Failed to process child ref {i}: {e}")
-                continue
+    def _process_child_ref_safely(self, index: int, child_ref) -> dict[str, Any] | None:
+        """Process one body child, logging and skipping it if conversion fails.
 
-        return lexical_nodes
+        Keeps the exception handling around the conversion itself; progress
+        reporting in the calling loops goes through _report_body_progress.
+        """
+        try:
+            if not child_ref.cref:
+                return None
+            return self._process_single_child_ref_optimized(child_ref)
+        except Exception as e:
+            logger.warning(f"Failed to process child ref {index}: {e}")
+            return None
 
     def _process_single_child_ref_optimized(self, child_ref) -> dict[str, Any] | None:
         """Process a single child reference with optimizations."""
@@ -941,14 +1080,8 @@ class LexicalDocSerializer(BaseDocSerializer):
 
         # Calculate format bitmask
         format_value = DEFAULT_FORMAT
-        if "bold" in format_types:
-            format_value |= FORMAT_BOLD
-        if "italic" in format_types:
-            format_value |= FORMAT_ITALIC
-        if "underline" in format_types:
-            format_value |= FORMAT_UNDERLINE
-        if "strikethrough" in format_types:
-            format_value |= FORMAT_STRIKETHROUGH
+        for fmt in format_types:
+            format_value |= FORMAT_FLAGS.get(fmt, 0)
 
         return {
             "detail": DEFAULT_DETAIL,
@@ -972,13 +1105,8 @@ class LexicalDocSerializer(BaseDocSerializer):
         Returns:
             List of Lexical nodes (text nodes or link nodes)
         """
-        import re
-
-        # URL pattern to detect links
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+' r'|www\.[^\s<>"{}|\\^`\[\]]+'
-
         # Find all URLs in the tex
-        urls = list(re.finditer(url_pattern, text_content))
+        urls = list(URL_PATTERN.finditer(text_content))
 
         if not urls:
             # No links found, return a single formatted text node
@@ -1066,6 +1194,7 @@ class LexicalDocSerializer(BaseDocSerializer):
     def _create_heading_node_optimized(self, text_item: SectionHeaderItem) -> dict[str, Any]:
         """Create optimized heading node."""
         # Check cache firs
+        cache_key = None
         if self._node_cache is not None:
             cache_key = f"heading_{text_item.text}_{getattr(text_item, 'level', 1)}"
             if cache_key in self._node_cache:
@@ -1092,9 +1221,9 @@ class LexicalDocSerializer(BaseDocSerializer):
                 "version": self.params.version,
             }
 
-            # Cache resul
-            if self._node_cache is not None:
-                cache_key = f"heading_{text_item.text}_{level}"
+            # Cache a copy so callers that modify the returned node cannot
+            # change what later cache hits hand out
+            if cache_key is not None:
                 self._node_cache[cache_key] = node.copy()
 
             return node
@@ -1125,20 +1254,12 @@ class LexicalDocSerializer(BaseDocSerializer):
     def _create_table_node_optimized(self, table_item: TableItem) -> dict[str, Any]:
         """Create optimized table node."""
         rows: list[dict[str, Any]] = []
+        version = self.params.version
 
         try:
             if table_item.data and table_item.data.grid:
                 for row in table_item.data.grid:
                     try:
-                        lexical_row = {
-                            "children": [],
-                            "direction": TEXT_DIRECTION_LTR,
-                            "format": DEFAULT_STYLE,
-                            "indent": DEFAULT_INDENT,
-                            "type": NODE_TYPE_TABLE_ROW,
-                            "version": self.params.version,
-                        }
-
                         # Process cells in batch
                         cells = []
                         for cell in row:
@@ -1152,20 +1273,29 @@ class LexicalDocSerializer(BaseDocSerializer):
                                     "format": DEFAULT_STYLE,
                                     "indent": DEFAULT_INDENT,
                                     "type": NODE_TYPE_TABLE_CELL,
-                                    "version": self.params.version,
+                                    "version": version,
                                 }
 
                                 # Add header state efficiently
-                                if hasattr(cell, "column_header") and cell.column_header:
+                                if getattr(cell, "column_header", False):
                                     lexical_cell["headerState"] = HEADER_STATE_VALUE
 
                                 cells.append(lexical_cell)
                             except (AttributeError, TypeError):
                                 continue
 
-                        lexical_row["children"] = cells
-                        if cells:  # Only add rows with cells
-                            rows.append(lexical_row)
+                        # Only allocate row nodes for rows with cells
+                        if cells:
+                            rows.append(
+                                {
+                                    "children": cells,
+                                    "direction": TEXT_DIRECTION_LTR,
+                                    "format": DEFAULT_STYLE,
+                                    "indent": DEFAULT_INDENT,
+                                    "type": NODE_TYPE_TABLE_ROW,
+                                    "version": version,
+                                }
+                            )
 
                     except (AttributeError, TypeError):
                         continue
@@ -1204,10 +1334,9 @@ class LexicalDocSerializer(BaseDocSerializer):
                         text_index = int(ref_parts[2])
                         if text_index < len(self.doc.texts):
                             first_text = getattr(self.doc.texts[text_index], "text", "") or ""
-                            if first_text and ". " in first_text:
-                                prefix = first_text.split(". ", 1)[0].strip()
-                                if prefix.isdigit():
-                                    list_type = LIST_TYPE_ORDERED
+                            prefix, separator, _ = first_text.partition(LIST_MARKER_SEPARATOR)
+                            if separator and prefix.strip().isdigit():
+                                list_type = LIST_TYPE_ORDERED
                     except (ValueError, IndexError, AttributeError):
                         pass
         except (AttributeError, TypeError):
@@ -1230,13 +1359,13 @@ class LexicalDocSerializer(BaseDocSerializer):
                         text_item = self.doc.texts[text_index]
                         text_content = text_item.text
 
-                        # Remove list markers efficiently
-                        if text_content.startswith("● ") or text_content.startswith("• "):
+                        # Remove list markers in a single scan of the text
+                        if text_content.startswith(LIST_BULLET_MARKERS):
                             text_content = text_content[2:]
-                        elif ". " in text_content:
-                            parts = text_content.split(". ", 1)
-                            if parts[0].isdigit():
-                                text_content = parts[1]
+                        else:
+                            number, separator, rest = text_content.partition(LIST_MARKER_SEPARATOR)
+                            if separator and number.isdigit():
+                                text_content = rest
 
                         # Process text optimally
                         if self.params.optimize_text_formatting:
@@ -1303,10 +1432,7 @@ class LexicalDocSerializer(BaseDocSerializer):
             return [self._create_formatted_text_node_optimized(text_content, format_types)]
 
         # Use simplified URL detection
-        import re
-
-        url_pattern = r"https?://\S+|www\.\S+"
-        urls = list(re.finditer(url_pattern, text_content))
+        urls = list(SIMPLE_URL_PATTERN.finditer(text_content))
 
         if not urls:
             format_types = self._detect_text_formatting_optimized(text_content, text_item)
@@ -1346,17 +1472,11 @@ class LexicalDocSerializer(BaseDocSerializer):
         self, text_content: str, format_types: list[str]
     ) -> dict[str, Any]:
         """Create optimized formatted text node."""
-        # Calculate format bitmask efficiently
+        # Table lookup per format instead of a string comparison chain
         format_value = 0
+        flags = FORMAT_FLAGS
         for fmt in format_types:
-            if fmt == "bold":
-                format_value |= FORMAT_BOLD
-            elif fmt == "italic":
-                format_value |= FORMAT_ITALIC
-            elif fmt == "underline":
-                format_value |= FORMAT_UNDERLINE
-            elif fmt == "strikethrough":
-                format_value |= FORMAT_STRIKETHROUGH
+            format_value |= flags.get(fmt, 0)
 
         return {
             "detail": DEFAULT_DETAIL,
@@ -1536,7 +1656,7 @@ class LexicalDocSerializer(BaseDocSerializer):
 
     def get_performance_stats(self) -> dict[str, Any]:
         """Get current performance statistics."""
-        duration = (time.time() - self._start_time) * 1000 if self._start_time > 0 else 0
+        duration = (time.perf_counter() - self._start_time) * 1000 if self._start_time > 0 else 0
 
         return {
             "elements_processed": self._elements_processed,
@@ -1,12 +1,11 @@
 """Serializer provider following Docling's factory pattern with extensibility support."""
 
+import importlib
+
 # Forward reference for LexicalDocSerializer to avoid circular imports
 from typing import TYPE_CHECKING, Any, Union
 
 from docling_core.transforms.serializer.common import BaseDocSerializer
-from docling_core.transforms.serializer.doctags import DocTagsDocSerializer
-from docling_core.transforms.serializer.html import HTMLDocSerializer
-from docling_core.transforms.serializer.markdown import MarkdownDocSerializer
 from docling_core.types import DoclingDocument
 
 if TYPE_CHECKING:
@@ -15,16 +14,23 @@ if TYPE_CHECKING:
 # Type alias for any serializer (docling-core or our custom ones)
 AnySerializer = Union[BaseDocSerializer, "LexicalDocSerializer"]
 
+# Built-in docling-core serializers as (module, class name), imported on first
+# use: loading their modules adds noticeably to import time, and most callers
+# only ever produce Lexical output
+_BUILTIN_SERIALIZERS: dict[str, tuple[str, str]] = {
+    "markdown": ("docling_core.transforms.serializer.markdown", "MarkdownDocSerializer"),
+    "md": ("docling_core.transforms.serializer.markdown", "MarkdownDocSerializer"),
+    "doctags": ("docling_core.transforms.serializer.doctags", "DocTagsDocSerializer"),
+    "html": ("docling_core.transforms.serializer.html", "HTMLDocSerializer"),
+}
+
 
 class SerializerProvider:
     """Factory for creating serializer instances following Docling patterns with extensibility support."""
 
-    _serializers: dict[str, type[BaseDocSerializer]] = {
-        "markdown": MarkdownDocSerializer,
-        "md": MarkdownDocSerializer,
-        "doctags": DocTagsDocSerializer,
-        "html": HTMLDocSerializer,
-    }
+    # Registered serializers and built-ins already imported; a registration
+    # overrides the built-in of the same name
+    _serializers: dict[str, type[BaseDocSerializer]] = {}
 
     # Integration with format registry
     _registry_integration_enabled = True
@@ -36,6 +42,29 @@ class SerializerProvider:
 
         return LexicalDocSerializer
 
+    @classmethod
+    def _lookup_serializer(cls, format_key: str) -> type[BaseDocSerializer] | None:
+        """Return the serializer class for a format, importing a built-in on first use.
+
+        Args:
+            format_key: Normalized format name.
+
+        Returns:
+            type[BaseDocSerializer] | None: Serializer class, or None if the
+                format is neither registered nor built in.
+        """
+        serializer_cls = cls._serializers.get(format_key)
+        if serializer_cls is None and format_key in _BUILTIN_SERIALIZERS:
+            module_name, class_name = _BUILTIN_SERIALIZERS[format_key]
+            serializer_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._serializers[format_key] = serializer_cls
+        return serializer_cls
+
+    @classmethod
+    def _builtin_and_registered(cls) -> list[str]:
+        """List built-in and registered format names, without importing anything."""
+        return list({**_BUILTIN_SERIALIZERS, **cls._serializers})
+
     @classmethod
     def get_serializer(cls, format_name: str, doc: DoclingDocument, **kwargs: Any) -> AnySerializer:
         """Get a serializer instance for the specified format.
@@ -61,8 +90,8 @@ class SerializerProvider:
         if format_key == "lexical":
             serializer_cls: Any = cls._get_lexical_serializer()
             return serializer_cls(doc=doc, **kwargs)  # type: ignore[call-arg]
-        if format_key in cls._serializers:
-            serializer_cls = cls._serializers[format_key]
+        serializer_cls = cls._lookup_serializer(format_key)
+        if serializer_cls is not None:
             return serializer_cls(doc=doc, **kwargs)  # type: ignore[call-arg]
 
         # Check format registry for extended formats
@@ -115,7 +144,7 @@ class SerializerProvider:
         Returns:
             list[str]: List of supported format names.
         """
-        formats = list(cls._serializers.keys()) + ["lexical"]
+        formats = cls._builtin_and_registered() + ["lexical"]
 
         # Add formats from registry
         if cls._registry_integration_enabled:
@@ -148,7 +177,9 @@ class SerializerProvider:
         format_key = format_name.lower().strip()
 
         # Check built-in formats
-        if format_key in cls._serializers or format_key == "lexical":
+        if format_key == "lexical" or format_key in _BUILTIN_SERIALIZERS:
+            return True
+        if format_key in cls._serializers:
             return True
 
         # Check format registry
@@ -173,11 +204,16 @@ class SerializerProvider:
         formats = {}
 
         # Add built-in formats
-        for format_name in cls._serializers:
+        for format_name in cls._builtin_and_registered():
+            registered = cls._serializers.get(format_name)
             formats[format_name] = {
                 "name": format_name,
                 "source": "builtin",
-                "serializer_class": cls._serializers[format_name].__name__,
+                "serializer_class": (
+                    registered.__name__
+                    if registered is not None
+                    else _BUILTIN_SERIALIZERS[format_name][1]
+                ),
             }
 
         # Add lexical format
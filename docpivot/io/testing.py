@@ -4,11 +4,12 @@ This module provides comprehensive testing utilities for validating
 custom readers and serializers in DocPivot's extensibility system.
 """
 
+import contextlib
 import tempfile
 import unittest
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from docling_core.transforms.serializer.common import BaseDocSerializer
 from docling_core.types import DoclingDocument
@@ -82,21 +83,57 @@ class CustomFormatTestBase(unittest.TestCase, ABC):
         """
         return []
 
+    # Per-test temporary directory, created on first use
+    _temp_path: Path | None = None
+
+    # FormatValidator keeps no state between checks, so one serves the class
+    validator: ClassVar[FormatValidator]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up class-wide test environment."""
+        super().setUpClass()
+        cls.validator = FormatValidator()
+
     def setUp(self) -> None:
         """Set up test environment."""
         super().setUp()
-        self.validator = FormatValidator()
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_path = Path(self.temp_dir)
+        self._temp_path = None
 
     def tearDown(self) -> None:
         """Clean up test environment."""
         super().tearDown()
-        # Clean up temporary files
-        import shutil
+        if self._temp_path is not None:
+            # Clean up temporary files
+            import shutil
 
-        if self.temp_path.exists():
-            shutil.rmtree(self.temp_path)
+            # Tolerate a directory the test already removed, but let real
+            # cleanup failures (permissions, open files) surface
+            with contextlib.suppress(FileNotFoundError):
+                shutil.rmtree(self._temp_path)
+
+    @property
+    def temp_path(self) -> Path:
+        """Temporary directory for this test, created on first access.
+
+        Tests that never write files skip the mkdtemp/rmtree pair.
+        """
+        if self._temp_path is None:
+            self._temp_path = Path(tempfile.mkdtemp())
+        return self._temp_path
+
+    @temp_path.setter
+    def temp_path(self, value: str | Path) -> None:
+        self._temp_path = Path(value)
+
+    @property
+    def temp_dir(self) -> str:
+        """Temporary directory for this test as a string, created on first access."""
+        return str(self.temp_path)
+
+    @temp_dir.setter
+    def temp_dir(self, value: str | Path) -> None:
+        self._temp_path = Path(value)
 
     def test_reader_interface_compliance(self) -> None:
         """Test that reader follows interface correctly."""
@@ -479,8 +479,7 @@ class FormatValidator:
             if test_file:
                 # Use provided test file
                 doc = reader.load_data(test_file)
-                with Path(test_file).open(encoding="utf-8") as f:
-                    original_content = f.read()
+                original_content = Path(test_file).read_text(encoding="utf-8")
             else:
                 # Create simple test document
 
@@ -21,6 +21,15 @@ from docpivot.io.readers.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for parsing when installed; its JSONDecodeError subclasses the
+# standard library's, so error handling is shared
+try:
+    import orjson
+
+    _fast_json_loads = orjson.loads
+except ImportError:
+    _fast_json_loads = None
+
 
 class DocumentValidator:
     """Validator for DoclingDocument structure and content."""
@@ -110,7 +119,7 @@ class DocumentValidator:
             SchemaValidationError: If schema validation fails
         """
         # Check required fields
-        missing_fields = self.REQUIRED_DOCLING_FIELDS - set(doc_dict.keys())
+        missing_fields = self.REQUIRED_DOCLING_FIELDS.difference(doc_dict)
         if missing_fields:
             raise SchemaValidationError(
                 f"DoclingDocument missing required fields{f' in {file_path}' if file_path else ''}: "
@@ -235,7 +244,7 @@ class LexicalValidator:
             )
 
         # Validate required root fields
-        missing_fields = self.REQUIRED_ROOT_FIELDS - set(json_data.keys())
+        missing_fields = self.REQUIRED_ROOT_FIELDS.difference(json_data)
         if missing_fields:
             raise SchemaValidationError(
                 f"Lexical JSON missing required fields{f' in {file_path}' if file_path else ''}: "
@@ -271,7 +280,7 @@ class LexicalValidator:
             )
 
         # Check required root node fields
-        missing_fields = self.REQUIRED_ROOT_NODE_FIELDS - set(root_node.keys())
+        missing_fields = self.REQUIRED_ROOT_NODE_FIELDS.difference(root_node)
         if missing_fields:
             raise ValidationError(
                 f"Lexical JSON root node missing required fields{f' in {file_path}' if file_path else ''}: "
@@ -350,7 +359,7 @@ class ParameterValidator:
             )
 
         if allowed_params is not None:
-            invalid_params = set(params.keys()) - allowed_params
+            invalid_params = params.keys() - allowed_params
             if invalid_params:
                 raise ConfigurationError(
                     f"Invalid parameters for {serializer_type} serializer: "
@@ -428,6 +437,21 @@ class ParameterValidator:
 class JsonValidator:
     """Validator for JSON content and structure."""
 
+    @staticmethod
+    def _loads(content: str) -> Any:
+        """Parse JSON with orjson when available, else the standard library.
+
+        orjson is stricter than the standard library (no NaN/Infinity literals,
+        integers limited to 64 bits), so content it rejects is re-parsed with
+        the standard library, which either accepts it or raises the error.
+        """
+        if _fast_json_loads is not None:
+            try:
+                return _fast_json_loads(content)
+            except json.JSONDecodeError:
+                pass
+        return json.loads(content)
+
     def validate_json_content(self, content: str, file_path: str | None = None) -> dict[str, Any]:
         """Validate and parse JSON content.
 
@@ -459,7 +483,7 @@ class JsonValidator:
             )
 
         try:
-            json_data = json.loads(content)
+            json_data = self._loads(content)
             logger.debug(
                 f"JSON content validation completed{f' for {file_path}' if file_path else ''}"
             )
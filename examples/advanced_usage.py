@@ -6,10 +6,14 @@ custom configurations, and integration patterns.
 """
 
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
-from docpivot import DocPivotEngine, get_debug_config, get_performance_config
+from docpivot import DoclingJsonReader, DocPivotEngine, get_debug_config, get_performance_config
+from docpivot.io.serializers import SerializerProvider
 
 # Optional imports
 try:
@@ -19,6 +23,37 @@ try:
 except ImportError:
     HAS_DOCLING_CORE = False
 
+# Prefer orjson for parsing large Lexical output; it accepts str directly
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+SAMPLE_DOCUMENT = Path("data/json/2025-07-03-Test-PDF-Styles.docling.json")
+
+
+def _usable_cpu_count() -> int:
+    """Number of CPUs this process may run on (respects affinity and cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _convert_json_worker(input_file: Path, output_file: Path) -> dict[str, Any]:
+    """Convert one Docling JSON file to Lexical (runs in a worker process)."""
+    engine = DocPivotEngine(lexical_config=get_performance_config())
+    result = engine.convert_file(input_file, output_path=output_file)
+    return {
+        "input": input_file.name,
+        "output": output_file.name,
+        "size": len(result.content),
+        "elements": result.metadata.get("elements_count", 0),
+    }
+
 
 def batch_processing_example():
     """Process multiple files in batch."""
@@ -26,9 +61,6 @@ def batch_processing_example():
     print("Batch Processing Example")
     print("=" * 60)
 
-    # Use performance configuration for batch processing
-    engine = DocPivotEngine(lexical_config=get_performance_config())
-
     # Find all Docling JSON files
     input_dir = Path("data")
     output_dir = Path("output/batch")
@@ -41,29 +73,26 @@ def batch_processing_example():
 
     print(f"Found {len(json_files)} files to process")
 
-    # Process each file
+    # Parsing and serialization are CPU-bound, so convert files in parallel
+    # processes, each using the performance configuration
     results = []
-    for input_file in json_files:
-        try:
-            # Define output path
-            output_file = output_dir / f"{input_file.stem}.lexical.json"
-
-            # Convert file
-            result = engine.convert_file(input_file, output_path=output_file)
-
-            results.append(
-                {
-                    "input": input_file.name,
-                    "output": output_file.name,
-                    "size": len(result.content),
-                    "elements": result.metadata.get("elements_count", 0),
-                }
-            )
-
-            print(f"✓ Processed: {input_file.name}")
-
-        except Exception as e:
-            print(f"✗ Failed: {input_file.name} - {e}")
+    max_workers = min(len(json_files), _usable_cpu_count())
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _convert_json_worker,
+                input_file,
+                output_dir / f"{input_file.stem}.lexical.json",
+            ): input_file
+            for input_file in json_files
+        }
+        for future in as_completed(futures):
+            input_file = futures[future]
+            try:
+                results.append(future.result())
+                print(f"✓ Processed: {input_file.name}")
+            except Exception as e:
+                print(f"✗ Failed: {input_file.name} - {e}")
 
     # Summary
     if results:
@@ -74,7 +103,34 @@ def batch_processing_example():
             print(f"    Size: {r['size']:,} bytes, Elements: {r['elements']}")
 
 
-def debug_mode_example():
+def load_sample_document(sample: Path = SAMPLE_DOCUMENT) -> Any:
+    """Parse the shared sample document once, or return None if it is missing."""
+    if not sample.exists():
+        return None
+    return DoclingJsonReader().load_data(sample)
+
+
+def multi_format_example(doc: Any = None):
+    """Serialize a loaded document to several formats."""
+    print("\n" + "=" * 60)
+    print("Multi-Format Serialization Example")
+    print("=" * 60)
+
+    if doc is None:
+        print(f"ℹ️  Sample file not found: {SAMPLE_DOCUMENT}")
+        return
+
+    # The document was parsed once up front; every serializer below reuses it
+    for fmt in ("markdown", "html", "lexical"):
+        result = SerializerProvider.get_serializer(fmt, doc=doc).serialize()
+        print(f"✓ {fmt}: {len(result.text):,} characters")
+
+    print("\nHigh-throughput pattern:")
+    print("  • Load each input document once")
+    print("  • Reuse the loaded document for every output format")
+
+
+def debug_mode_example(doc: Any = None):
     """Use debug configuration for troubleshooting."""
     print("\n" + "=" * 60)
     print("Debug Mode Example")
@@ -90,8 +146,9 @@ def debug_mode_example():
     print("  • All content types enabled")
 
     if HAS_DOCLING_CORE:
-        # Create a sample document
-        doc = DoclingDocument(name="debug_test")
+        # Reuse the preloaded sample document, or create an empty one
+        if doc is None:
+            doc = DoclingDocument(name="debug_test")
 
         # Convert with full debug output
         result = engine.convert_to_lexical(doc)
@@ -150,7 +207,7 @@ def custom_processing_pipeline():
 
             # Parse content to get statistics
             try:
-                content_data = json.loads(result.content)
+                content_data = json_loads(result.content)
                 node_count = self._count_nodes(content_data)
             except Exception:
                 node_count = 0
@@ -165,15 +222,17 @@ def custom_processing_pipeline():
             }
 
         def _count_nodes(self, data: Any) -> int:
-            """Recursively count nodes in the Lexical structure."""
-            if isinstance(data, dict):
-                count = 1
-                for value in data.values():
-                    count += self._count_nodes(value)
-                return count
-            if isinstance(data, list):
-                return sum(self._count_nodes(item) for item in data)
-            return 0
+            """Count nodes in the Lexical structure using an explicit stack."""
+            count = 0
+            stack = [data]
+            while stack:
+                value = stack.pop()
+                if type(value) is dict:
+                    count += 1
+                    stack.extend(value.values())
+                elif type(value) is list:
+                    stack.extend(value)
+            return count
 
     # Use the custom processor
     processor = DocumentProcessor()
@@ -234,6 +293,37 @@ def memory_efficient_processing():
         print("  by streaming to disk instead of memory")
 
 
+def caching_example(sample: Path = SAMPLE_DOCUMENT):
+    """Compare a cold load with a cached load of the same document."""
+    print("\n" + "=" * 60)
+    print("Caching Performance")
+    print("=" * 60)
+
+    if not sample.exists():
+        print(f"ℹ️  Sample file not found: {sample}")
+        return
+
+    # Warm up on a throwaway reader first so the cold timing below measures
+    # disk + parse only, not first-call costs such as lazy imports, the
+    # JSON parser's own setup or filling the OS page cache
+    DoclingJsonReader(use_fast_json=True).load_data(sample)
+
+    reader = DoclingJsonReader(use_fast_json=True, enable_caching=True)
+
+    start_time = time.perf_counter()
+    reader.load_data(sample)
+    first_load_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    reader.load_data(sample)
+    second_load_time = time.perf_counter() - start_time
+
+    print(f"✓ Cold load:   {first_load_time * 1000:.2f}ms")
+    print(f"✓ Cached load: {second_load_time * 1000:.2f}ms")
+    if second_load_time > 0:
+        print(f"  Speedup: {first_load_time / second_load_time:.1f}x")
+
+
 def error_handling_example():
     """Demonstrate proper error handling."""
     print("\n" + "=" * 60)
@@ -277,18 +367,26 @@ def main():
     print("=" * 60)
 
     batch_processing_example()
-    debug_mode_example()
+
+    # Parse the sample document once and hand it to every section that needs it
+    sample_doc = load_sample_document()
+
+    multi_format_example(sample_doc)
+    debug_mode_example(sample_doc)
     custom_processing_pipeline()
     memory_efficient_processing()
+    caching_example()
     error_handling_example()
 
     print("\n" + "=" * 60)
     print("Advanced Features Summary:")
     print("=" * 60)
     print("• Batch processing with performance config")
+    print("• Multi-format output from a single load")
     print("• Debug mode for troubleshooting")
     print("• Custom processing pipelines")
     print("• Memory-efficient large file handling")
+    print("• Document caching for repeated loads")
     print("• Comprehensive error handling")
     print("=" * 60 + "\n")
 
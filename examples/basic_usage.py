@@ -57,24 +57,21 @@ def example_2_file_conversion():
 
     engine = DocPivotEngine()
 
-    # Convert from a Docling JSON file
+    # Convert from a Docling JSON file and save to a specific output file.
+    # A single convert_file call parses the input once and writes the result.
     input_file = Path("data/sample.docling.json")
-    if input_file.exists():
-        result = engine.convert_file(input_file)
-        print(f"✓ Converted {input_file.name}")
-        print(f"✓ Format: {result.format}")
-        print(f"✓ Elements: {result.metadata.get('elements_count', 'N/A')}")
-    else:
-        print(f"ℹ️  Sample file not found: {input_file}")
-
-    # Convert and save to a specific output file
     output_file = Path("output/converted.lexical.json")
     if input_file.exists():
         output_file.parent.mkdir(parents=True, exist_ok=True)
         result = engine.convert_file(
             input_file, output_path=output_file, pretty=True  # Make output human-readable
         )
+        print(f"✓ Converted {input_file.name}")
+        print(f"✓ Format: {result.format}")
+        print(f"✓ Elements: {result.metadata.get('elements_count', 'N/A')}")
         print(f"✓ Saved to: {result.metadata['output_path']}")
+    else:
+        print(f"ℹ️  Sample file not found: {input_file}")
 
 
 def example_3_pdf_conversion():
@@ -8,7 +8,9 @@ output format (Lexical).
 
 import html
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # DocPivot simplified API
@@ -27,100 +29,172 @@ except ImportError:
     print("Install with: pip install docling")
     sys.exit(1)
 
+# orjson serializes large DoclingDocument dicts much faster than json.dump
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Large write buffer so multi-MB JSON exports reach disk in few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Each batch worker process loads its own docling models, so cap the pool
+MAX_BATCH_WORKERS = 2
+
+# JSON outputs are compact unless DOCPIVOT_PRETTY=1 asks for indented, human-readable files
+PRETTY_JSON = os.environ.get("DOCPIVOT_PRETTY", "0") == "1"
+
+
+def _dump_json_stream(obj, fp):
+    """Write obj as JSON chunk by chunk without building the whole string.
+
+    The encoder emits many small chunks; the caller's large file buffer
+    coalesces them into few writes.
+    """
+    if PRETTY_JSON:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+    fp.writelines(encoder.iterencode(obj))
 
-def convert_pdf_to_multiple_formats(pdf_path: Path, output_dir: Path):
+
+def _write_text(path: Path, text: str):
+    """Write a text output file as UTF-8, encoding it in one pass."""
+    path.write_bytes(text.encode("utf-8"))
+
+
+def _write_docling_json(path: Path, obj):
+    """Write the exported DoclingDocument dict as JSON."""
+    if HAS_ORJSON:
+        # orjson returns the whole document as one bytes object, so a single write suffices
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0))
+    else:
+        with path.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as fp:
+            _dump_json_stream(obj, fp)
+
+
+def _quiet(*args, **kwargs):
+    """Discard progress output."""
+
+
+def convert_pdf_to_multiple_formats(pdf_path: Path, output_dir: Path, verbose: bool = True):
     """Convert a PDF to Docling JSON, Markdown, and Lexical formats.
 
     This mirrors the workflow from TEMP_pdf2docling.py but adds
-    Lexical format conversion using DocPivot.
+    Lexical format conversion using DocPivot. Pass verbose=False to
+    suppress the step-by-step progress output.
     """
-    print("=" * 60)
-    print(f"Converting: {pdf_path.name}")
-    print("=" * 60)
+    log = print if verbose else _quiet
+    log("=" * 60)
+    log(f"Converting: {pdf_path.name}")
+    log("=" * 60)
 
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Step 1: Convert PDF using Docling
     converter = DocumentConverter()
-    print(f"\n1. Reading PDF: {pdf_path}")
+    log(f"\n1. Reading PDF: {pdf_path}")
     conv_result: ConversionResult = converter.convert(str(pdf_path))
 
     # Get the document and filename
     doc_filename = conv_result.input.file.stem
     dl_doc: DoclingDocument = conv_result.document
 
-    print("   ✓ Converted to DoclingDocument")
-    print(f"   Document name: {dl_doc.name}")
-
-    # Step 2: Export to Markdown (native Docling)
-    print("\n2. Exporting to Markdown (native Docling):")
-    output_md = html.unescape(dl_doc.export_to_markdown())
-
-    outfile_md = output_dir / f"{doc_filename}.md"
-    with outfile_md.open("w", encoding="utf-8") as fp:
-        fp.write(output_md)
-
-    print(f"   ✓ Saved: {outfile_md}")
-    print(f"   Size: {len(output_md):,} characters")
-
-    # Show first 500 chars of markdown
-    print("\n   Preview (first 500 chars):")
-    print("   " + "-" * 40)
-    preview = output_md[:500].replace("\n", "\n   ")
-    print(f"   {preview}")
-    print("   " + "-" * 40)
-
-    # Step 3: Export to Docling JSON (native Docling)
-    print("\n3. Exporting to Docling JSON (native Docling):")
-    output_json = dl_doc.export_to_dict()
-
-    outfile_json = output_dir / f"{doc_filename}.docling.json"
-    with outfile_json.open("w", encoding="utf-8") as fp:
-        json.dump(output_json, fp, indent=2)
-
-    print(f"   ✓ Saved: {outfile_json}")
-    print(f"   Size: {outfile_json.stat().st_size:,} bytes")
-
-    # Step 4: Export to Lexical JSON using DocPivot
-    print("\n4. Exporting to Lexical JSON (via DocPivot):")
-
-    # Create DocPivot engine with pretty printing for readability
-    engine = DocPivotEngine(
-        lexical_config={
-            "pretty": True,
-            "indent": 2,
-            "include_metadata": True,
-            "handle_images": True,
-            "handle_tables": True,
-            "handle_lists": True,
-        }
-    )
+    log("   ✓ Converted to DoclingDocument")
+    log(f"   Document name: {dl_doc.name}")
 
-    # Convert to Lexical format
-    result = engine.convert_to_lexical(dl_doc)
+    # Output files are written on background threads so disk I/O overlaps
+    # the export and conversion work that follows each write
+    with ThreadPoolExecutor(max_workers=3) as io_pool:
+        # Step 2: Export to Markdown (native Docling)
+        log("\n2. Exporting to Markdown (native Docling):")
+        output_md = html.unescape(dl_doc.export_to_markdown())
 
-    outfile_lexical = output_dir / f"{doc_filename}.lexical.json"
-    with outfile_lexical.open("w", encoding="utf-8") as fp:
-        fp.write(result.content)
+        outfile_md = output_dir / f"{doc_filename}.md"
+        md_write = io_pool.submit(_write_text, outfile_md, output_md)
 
-    print(f"   ✓ Saved: {outfile_lexical}")
-    print(f"   Size: {len(result.content):,} characters")
-    print(f"   Elements: {result.metadata.get('elements_count', 'N/A')}")
+        log(f"   ✓ Saving: {outfile_md}")
+        log(f"   Size: {len(output_md):,} characters")
+
+        # Show first 500 chars of markdown
+        log("\n   Preview (first 500 chars):")
+        log("   " + "-" * 40)
+        preview = output_md[:500].replace("\n", "\n   ")
+        log(f"   {preview}")
+        log("   " + "-" * 40)
+
+        # Drop local references to each export once it is handed to its writer,
+        # so it is freed as soon as the write finishes instead of staying alive
+        # alongside the next (larger) export
+        del output_md, preview
+
+        # Step 3: Export to Docling JSON (native Docling)
+        log("\n3. Exporting to Docling JSON (native Docling):")
+        output_json = dl_doc.export_to_dict()
+
+        outfile_json = output_dir / f"{doc_filename}.docling.json"
+        json_write = io_pool.submit(_write_docling_json, outfile_json, output_json)
+        del output_json
+
+        log(f"   ✓ Saving: {outfile_json}")
+
+        # Step 4: Export to Lexical JSON using DocPivot
+        log("\n4. Exporting to Lexical JSON (via DocPivot):")
+
+        # Create DocPivot engine (set DOCPIVOT_PRETTY=1 for readable, indented output)
+        engine = DocPivotEngine(
+            lexical_config={
+                "pretty": PRETTY_JSON,
+                "indent": 2,
+                "include_metadata": True,
+                "handle_images": True,
+                "handle_tables": True,
+                "handle_lists": True,
+            }
+        )
+
+        # Convert to Lexical format
+        result = engine.convert_to_lexical(dl_doc)
+
+        outfile_lexical = output_dir / f"{doc_filename}.lexical.json"
+        lexical_write = io_pool.submit(_write_text, outfile_lexical, result.content)
+
+        log(f"   ✓ Saving: {outfile_lexical}")
+        log(f"   Size: {len(result.content):,} characters")
+        log(f"   Elements: {result.metadata.get('elements_count', 'N/A')}")
+
+        # Wait for every write, re-raising any I/O error
+        for write in (md_write, json_write, lexical_write):
+            write.result()
+
+    log(f"\n   Docling JSON size: {outfile_json.stat().st_size:,} bytes")
 
     # Show summary
-    print("\n" + "=" * 60)
-    print("Conversion Summary:")
-    print("=" * 60)
-    print(f"Input PDF: {pdf_path.name}")
-    print(f"\nOutput files in {output_dir}:")
-    print(f"  1. {doc_filename}.md (Markdown)")
-    print(f"  2. {doc_filename}.docling.json (Docling JSON)")
-    print(f"  3. {doc_filename}.lexical.json (Lexical Editor JSON)")
+    log("\n" + "=" * 60)
+    log("Conversion Summary:")
+    log("=" * 60)
+    log(f"Input PDF: {pdf_path.name}")
+    log(f"\nOutput files in {output_dir}:")
+    log(f"  1. {doc_filename}.md (Markdown)")
+    log(f"  2. {doc_filename}.docling.json (Docling JSON)")
+    log(f"  3. {doc_filename}.lexical.json (Lexical Editor JSON)")
 
     return {"markdown": outfile_md, "docling_json": outfile_json, "lexical_json": outfile_lexical}
 
 
+def _convert_pdf_worker(pdf_path: Path, output_dir: Path):
+    """Convert one PDF into its own output subdirectory (runs in a worker process).
+
+    Progress output is suppressed so concurrent workers do not interleave
+    their logs; the parent prints the returned summary instead.
+    """
+    outputs = convert_pdf_to_multiple_formats(pdf_path, output_dir / pdf_path.stem, verbose=False)
+    return {name: (path, path.stat().st_size) for name, path in outputs.items()}
+
+
 def batch_convert_pdfs(input_dir: Path, output_dir: Path):
     """Convert all PDFs in a directory."""
     print("\n" + "=" * 60)
@@ -134,28 +208,32 @@ def batch_convert_pdfs(input_dir: Path, output_dir: Path):
 
     print(f"Found {len(pdf_files)} PDF files to convert\n")
 
-    results = []
-    for i, pdf_path in enumerate(pdf_files, 1):
-        print(f"\n[{i}/{len(pdf_files)}] Processing: {pdf_path.name}")
-        print("-" * 40)
-
-        try:
-            # Create subdirectory for each PDF's outputs
-            pdf_output_dir = output_dir / pdf_path.stem
-            outputs = convert_pdf_to_multiple_formats(pdf_path, pdf_output_dir)
-            results.append({"pdf": pdf_path.name, "status": "success", "outputs": outputs})
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-            results.append({"pdf": pdf_path.name, "status": "failed", "error": str(e)})
+    # Each PDF conversion is CPU-bound and independent, so fan out over processes.
+    # Every worker loads its own docling models, so keep the pool small
+    max_workers = min(len(pdf_files), os.cpu_count() or 1, MAX_BATCH_WORKERS)
+    successful, failed = [], []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_convert_pdf_worker, pdf_path, output_dir): pdf_path
+            for pdf_path in pdf_files
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_path = futures[future]
+            try:
+                outputs = future.result()
+                print(f"\n[{i}/{len(pdf_files)}] Finished: {pdf_path.name}")
+                for path, size in outputs.values():
+                    print(f"   {path} ({size:,} bytes)")
+                successful.append({"pdf": pdf_path.name, "outputs": outputs})
+            except Exception as e:
+                print(f"\n[{i}/{len(pdf_files)}] ✗ Error in {pdf_path.name}: {e}")
+                failed.append({"pdf": pdf_path.name, "error": str(e)})
 
     # Print summary
     print("\n" + "=" * 60)
     print("Batch Conversion Complete")
     print("=" * 60)
 
-    successful = [r for r in results if r["status"] == "success"]
-    failed = [r for r in results if r["status"] == "failed"]
-
     print(f"✓ Successful: {len(successful)}")
     for r in successful:
         print(f"  - {r['pdf']}")
@@ -215,6 +293,7 @@ def main():
     print("• DocPivot Lexical JSON export")
     print("• Batch processing of multiple PDFs")
     print("• Organized output directory structure")
+    print("• Compact JSON by default (DOCPIVOT_PRETTY=1 for indented output)")
     print("=" * 60 + "\n")
 
 
@@ -1,93 +1,149 @@
-"""Shared pytest fixtures for DocPivot tests."""
+"""Shared pytest fixtures for DocPivot tests.
 
+Read-only fixtures (data paths and sample content) are session-scoped so
+they are built once per test run; the default engine is shared per test
+class; anything a test may write to stays function-scoped.
+"""
+
+import copy
+import json
+import os
+from functools import cache
 from pathlib import Path
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 import pytest
 from docling_core.types import DoclingDocument
+from docling_core.types.doc.common.origin import DocumentOrigin
+from docling_core.types.doc.labels import DocItemLabel
 
+from docpivot import DoclingJsonReader, DocPivotEngine, LexicalJsonReader
 
-@pytest.fixture
+# Resolved once at import so data-file scans and stats skip symlink resolution
+DATA_DIR = (Path(__file__).parent.parent / "data").resolve()
+
+
+@cache
+def _first_data_file(subdir: str, suffix: str) -> Path | None:
+    """Return the first file in DATA_DIR/subdir whose name ends with suffix, scanning once."""
+    try:
+        with os.scandir(DATA_DIR / subdir) as entries:
+            return next((Path(e.path) for e in entries if e.name.endswith(suffix)), None)
+    except FileNotFoundError:
+        return None
+
+
+@pytest.fixture(scope="session")
 def test_data_dir():
     """Return path to test data directory."""
-    return Path(__file__).parent.parent / "data"
+    return DATA_DIR
 
 
-@pytest.fixture
-def sample_docling_json_path(test_data_dir):
+@pytest.fixture(scope="session")
+def sample_docling_json_path():
     """Return path to sample Docling JSON file."""
-    json_files = list((test_data_dir / "json").glob("*.docling.json"))
-    if json_files:
-        return json_files[0]
-    return None
+    return _first_data_file("json", ".docling.json")
 
 
-@pytest.fixture
-def sample_lexical_json_path(test_data_dir):
+@pytest.fixture(scope="session")
+def sample_lexical_json_path():
     """Return path to sample Lexical JSON file."""
-    json_files = list((test_data_dir / "json").glob("*.lexical.json"))
-    if json_files:
-        return json_files[0]
-    return None
+    return _first_data_file("json", ".lexical.json")
 
 
-@pytest.fixture
-def sample_pdf_path(test_data_dir):
+@pytest.fixture(scope="session")
+def sample_docling_json_content(sample_docling_json_path):
+    """Return the parsed sample Docling JSON, read once per session (treat as read-only)."""
+    if sample_docling_json_path is None:
+        return None
+    return json.loads(sample_docling_json_path.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_path():
     """Return path to sample PDF file."""
-    pdf_files = list((test_data_dir / "pdf").glob("*.pdf"))
-    if pdf_files:
-        return pdf_files[0]
-    return None
+    return _first_data_file("pdf", ".pdf")
+
+
+def _build_mock_docling_document() -> SimpleNamespace:
+    """Build the shared stand-in for a DoclingDocument.
+
+    Tests only read name, body.items and metadata, so a plain namespace is
+    enough and avoids Mock(spec=DoclingDocument) introspecting the whole
+    pydantic model and routing every attribute read through Mock.
+    """
+    return SimpleNamespace(
+        name="test_document",
+        body=SimpleNamespace(
+            items=[
+                SimpleNamespace(type="paragraph", text="Test paragraph"),
+                SimpleNamespace(type="heading", text="Test heading"),
+                SimpleNamespace(type="list", items=["item1", "item2"]),
+            ]
+        ),
+        metadata={"source": "test", "version": "1.0"},
+    )
+
+
+_MOCK_DOCLING_DOCUMENT = _build_mock_docling_document()
 
 
 @pytest.fixture
 def mock_docling_document():
-    """Create a mock DoclingDocument for testing."""
-    doc = Mock(spec=DoclingDocument)
-    doc.name = "test_document"
-    doc.body = Mock()
-    doc.body.items = [
-        Mock(type="paragraph", text="Test paragraph"),
-        Mock(type="heading", text="Test heading"),
-        Mock(type="list", items=["item1", "item2"]),
-    ]
-    doc.metadata = {"source": "test", "version": "1.0"}
+    """Return a shallow copy of the stand-in DoclingDocument built at import.
+
+    Each test may reassign top-level attributes such as name; the nested
+    body and metadata are shared, so treat those as read-only.
+    """
+    return copy.copy(_MOCK_DOCLING_DOCUMENT)
+
+
+@pytest.fixture(scope="session")
+def sample_docling_document():
+    """Return a small real DoclingDocument shared across the session.
+
+    Pydantic validation makes DoclingDocument construction comparatively
+    slow, so read-only tests share this instance. Tests that modify a
+    document should build their own.
+    """
+    doc = DoclingDocument(
+        name="test_document",
+        origin=DocumentOrigin(
+            mimetype="application/pdf",
+            binary_hash=12345,
+            filename="test_document.pdf",
+        ),
+    )
+    doc.add_text(label=DocItemLabel.TEXT, text="Hello world")
     return doc
 
 
+@pytest.fixture(scope="class")
+def default_engine():
+    """Return a default-configured DocPivotEngine shared within a test class.
+
+    Building an engine sets up a ReaderFactory and registers its readers,
+    so tests that only convert with the defaults reuse one. Tests that
+    patch the engine's collaborators or change its config build their own.
+    """
+    return DocPivotEngine()
+
+
+@pytest.fixture(scope="module")
+def docling_reader():
+    """Return a DoclingJsonReader shared within a test module."""
+    return DoclingJsonReader()
+
+
+@pytest.fixture(scope="module")
+def lexical_reader():
+    """Return a LexicalJsonReader shared within a test module."""
+    return LexicalJsonReader()
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path):
     """Create a temporary output directory."""
     output_dir = tmp_path / "output"
     output_dir.mkdir()
     return output_dir
-
-
-@pytest.fixture
-def sample_lexical_content():
-    """Return sample Lexical JSON content."""
-    return {
-        "root": {
-            "children": [
-                {
-                    "type": "paragraph",
-                    "children": [{"type": "text", "text": "Sample paragraph text"}],
-                }
-            ]
-        }
-    }
-
-
-@pytest.fixture
-def sample_docling_content():
-    """Return sample Docling content structure."""
-    return {
-        "name": "sample_document",
-        "body": {
-            "items": [
-                {"type": "paragraph", "text": "Sample paragraph"},
-                {"type": "heading", "text": "Sample heading", "level": 1},
-            ]
-        },
-        "metadata": {"source": "test"},
-    }
@@ -162,6 +162,17 @@ class TestDocPivotEngineBuilder:
         assert engine.lexical_config["indent"] == 8
         assert engine.lexical_config.get("custom_field") == "custom_value"
 
+    def test_builder_custom_config_not_affected_by_later_changes(self):
+        """Test the builder keeps the custom config values it was given."""
+        custom_config = {"pretty": True, "indent": 8}
+        builder = DocPivotEngineBuilder().with_lexical_config(custom_config)
+        custom_config["indent"] = 1
+
+        engine = builder.build()
+
+        assert engine.lexical_config["indent"] == 8
+        assert engine.lexical_config is not custom_config
+
     def test_builder_chaining_complex(self):
         """Test complex chaining of builder methods."""
         engine = (
@@ -183,6 +194,16 @@ class TestDocPivotEngineBuilder:
         # Format should be lexical
         assert engine.default_format == "lexical"
 
+    def test_builder_builds_independent_configs(self):
+        """Test each build gets its own config unaffected by later builder calls."""
+        builder = DocPivotEngineBuilder().with_metadata(False)
+        first = builder.build()
+        second = builder.with_metadata(True).build()
+
+        assert first.lexical_config["include_metadata"] is False
+        assert second.lexical_config["include_metadata"] is True
+        assert first.lexical_config is not second.lexical_config
+
     def test_builder_static_method_access(self):
         """Test accessing builder via DocPivotEngine.builder()."""
         engine = DocPivotEngine.builder().build()
@@ -1,16 +1,24 @@
 """Tests for core DocPivot functionality."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
+import docpivot.engine as engine_module
 from docpivot import ConversionResult, DocPivotEngine
 
 
 class TestDocPivotEngineCore:
     """Test core engine functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _mock_collaborators(self, monkeypatch):
+        """Swap the engine's collaborators for fresh mocks; monkeypatch restores them."""
+        for name in ("LexicalDocSerializer", "ReaderFactory", "DocumentConverter"):
+            monkeypatch.setattr(engine_module, name, Mock())
+
     def test_engine_initialization_default(self):
         """Test engine initializes with defaults."""
         engine = DocPivotEngine()
@@ -31,19 +39,22 @@ class TestDocPivotEngineCore:
     def test_engine_has_required_attributes(self):
         """Test engine has required attributes."""
         engine = DocPivotEngine()
-        assert hasattr(engine, "lexical_config")
-        assert hasattr(engine, "default_format")
-        assert hasattr(engine, "convert_to_lexical")
-        assert hasattr(engine, "convert_file")
-        assert hasattr(engine, "convert_pdf")
-
-    @patch("docpivot.engine.LexicalDocSerializer")
-    def test_convert_to_lexical_success(self, mock_serializer_class, mock_docling_document):
+        # dir() walks the MRO and includes instance attributes and properties
+        required = {
+            "lexical_config",
+            "default_format",
+            "convert_to_lexical",
+            "convert_file",
+            "convert_pdf",
+        }
+        assert required <= set(dir(engine))
+
+    def test_convert_to_lexical_success(self, mock_docling_document):
         """Test successful conversion to Lexical format."""
         # Setup mock serializer
+        mock_serializer_class = engine_module.LexicalDocSerializer
         mock_serializer = Mock()
-        mock_result = Mock()
-        mock_result.text = '{"root": {"children": []}}'
+        mock_result = SimpleNamespace(text='{"root": {"children": []}}')
         mock_serializer.serialize.return_value = mock_result
         mock_serializer_class.return_value = mock_serializer
 
@@ -60,14 +71,11 @@ class TestDocPivotEngineCore:
         mock_serializer_class.assert_called_once_with(mock_docling_document)
         mock_serializer.serialize.assert_called_once()
 
-    @patch("docpivot.engine.LexicalDocSerializer")
-    def test_convert_to_lexical_with_custom_config(
-        self, mock_serializer_class, mock_docling_document
-    ):
+    def test_convert_to_lexical_with_custom_config(self, mock_docling_document):
         """Test conversion with custom configuration."""
+        mock_serializer_class = engine_module.LexicalDocSerializer
         mock_serializer = Mock()
-        mock_result = Mock()
-        mock_result.text = '{"formatted": true}'
+        mock_result = SimpleNamespace(text='{"formatted": true}')
         mock_serializer.serialize.return_value = mock_result
         mock_serializer_class.return_value = mock_serializer
 
@@ -78,16 +86,7 @@ class TestDocPivotEngineCore:
         # Verify the serializer was created with the document
         mock_serializer_class.assert_called_with(mock_docling_document)
 
-    def test_convert_file_not_found(self):
-        """Test handling of non-existent file."""
-        engine = DocPivotEngine()
-        non_existent = Path("/path/that/does/not/exist.json")
-
-        with pytest.raises(FileNotFoundError):
-            engine.convert_file(non_existent)
-
-    @patch("docpivot.engine.ReaderFactory")
-    def test_convert_file_success(self, mock_factory_class, tmp_path, mock_docling_document):
+    def test_convert_file_success(self, tmp_path, mock_docling_document):
         """Test successful file conversion."""
         # Create test file
         test_file = tmp_path / "test.json"
@@ -98,7 +97,7 @@ class TestDocPivotEngineCore:
         mock_reader = Mock()
         mock_reader.load_data.return_value = mock_docling_document
         mock_factory.get_reader.return_value = mock_reader
-        mock_factory_class.return_value = mock_factory
+        engine_module.ReaderFactory.return_value = mock_factory
 
         engine = DocPivotEngine()
 
@@ -114,10 +113,7 @@ class TestDocPivotEngineCore:
             mock_reader.load_data.assert_called_once_with(test_file)
             mock_convert.assert_called_once_with(mock_docling_document)
 
-    @patch("docpivot.engine.ReaderFactory")
-    def test_convert_file_with_output_path(
-        self, mock_factory_class, tmp_path, mock_docling_document
-    ):
+    def test_convert_file_with_output_path(self, tmp_path, mock_docling_document):
         """Test file conversion with output path."""
         # Setup files
         input_file = tmp_path / "input.json"
@@ -129,7 +125,7 @@ class TestDocPivotEngineCore:
         mock_reader = Mock()
         mock_reader.load_data.return_value = mock_docling_document
         mock_factory.get_reader.return_value = mock_reader
-        mock_factory_class.return_value = mock_factory
+        engine_module.ReaderFactory.return_value = mock_factory
 
         engine = DocPivotEngine()
 
@@ -141,35 +137,32 @@ class TestDocPivotEngineCore:
             result = engine.convert_file(input_file, output_path=output_file)
 
             # Check file was written
-            assert output_file.exists()
-            assert output_file.read_text() == '{"converted": true}'
+            assert output_file.read_bytes() == b'{"converted": true}'
             assert result.metadata["output_path"] == str(output_file)
 
-    def test_convert_pdf_without_docling(self):
+    def test_convert_pdf_without_docling(self, monkeypatch):
         """Test PDF conversion raises error when docling not available."""
+        monkeypatch.setattr(engine_module, "HAS_DOCLING", False)
         engine = DocPivotEngine()
 
-        with (
-            patch("docpivot.engine.HAS_DOCLING", False),
-            pytest.raises(ImportError, match="docling"),
-        ):
+        with pytest.raises(ImportError, match="docling"):
             engine.convert_pdf("dummy.pdf")
 
-    @patch("docpivot.engine.HAS_DOCLING", True)
-    @patch("docpivot.engine.DocumentConverter")
-    def test_convert_pdf_success(self, mock_converter_class, tmp_path):
+    def test_convert_pdf_success(self, tmp_path, monkeypatch):
         """Test successful PDF conversion."""
+        monkeypatch.setattr(engine_module, "HAS_DOCLING", True)
+
         # Create test PDF file
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_bytes(b"PDF content")
 
         # Setup mock converter
         mock_converter = Mock()
-        mock_result = Mock()
-        mock_document = Mock()
-        mock_result.document = mock_document  # Use result.document as in the actual implementation
+        mock_document = object()
+        # Use result.document as in the actual implementation
+        mock_result = SimpleNamespace(document=mock_document)
         mock_converter.convert.return_value = mock_result
-        mock_converter_class.return_value = mock_converter
+        engine_module.DocumentConverter.return_value = mock_converter
 
         engine = DocPivotEngine()
 
@@ -191,34 +184,39 @@ class TestDocPivotEngineCore:
 class TestConversionResult:
     """Test ConversionResult class."""
 
-    def test_conversion_result_creation(self):
-        """Test creating ConversionResult."""
-        result = ConversionResult(
-            content='{"test": true}', format="lexical", metadata={"key": "value"}
-        )
-
-        assert result.content == '{"test": true}'
-        assert result.format == "lexical"
-        assert result.metadata["key"] == "value"
-
-    def test_conversion_result_metadata_update(self):
-        """Test updating ConversionResult metadata."""
-        result = ConversionResult(content="content", format="format", metadata={"initial": "value"})
+    @pytest.mark.parametrize(
+        ("content", "fmt", "metadata"),
+        [
+            ('{"test": true}', "lexical", {"key": "value"}),
+            ("content", "format", {"initial": "value"}),
+        ],
+    )
+    def test_conversion_result_fields_and_metadata_update(self, content, fmt, metadata):
+        """Test ConversionResult keeps its fields and accepts metadata updates."""
+        result = ConversionResult(content=content, format=fmt, metadata=dict(metadata))
+
+        assert result.content == content
+        assert result.format == fmt
+        assert result.metadata == metadata
 
         result.metadata["new_key"] = "new_value"
-        assert result.metadata["initial"] == "value"
-        assert result.metadata["new_key"] == "new_value"
+        assert result.metadata == {**metadata, "new_key": "new_value"}
 
 
 class TestErrorHandling:
     """Test error handling in DocPivot."""
 
-    def test_convert_file_invalid_path_type(self):
-        """Test handling invalid path type."""
-        engine = DocPivotEngine()
+    def test_convert_file_not_found(self, default_engine):
+        """Test handling of non-existent file."""
+        non_existent = Path("/path/that/does/not/exist.json")
 
+        with pytest.raises(FileNotFoundError):
+            default_engine.convert_file(non_existent)
+
+    def test_convert_file_invalid_path_type(self, default_engine):
+        """Test handling invalid path type."""
         with pytest.raises(TypeError):
-            engine.convert_file(123)  # Not a path
+            default_engine.convert_file(123)  # Not a path
 
     @patch("docpivot.engine.ReaderFactory")
     def test_convert_file_reader_error(self, mock_factory_class, tmp_path):
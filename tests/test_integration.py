@@ -6,68 +6,125 @@ from pathlib import Path
 import pytest
 
 from docpivot import ConversionResult, DocPivotEngine
+from docpivot.io.readers.exceptions import FileAccessError, ValidationError
 
 
 class TestIntegrationWithRealFiles:
     """Test with real data files from data/ directory."""
 
-    def test_convert_docling_json_file(self, sample_docling_json_path):
+    def test_convert_docling_json_file(self, sample_docling_json_path, default_engine):
         """Test converting real Docling JSON file."""
         if not sample_docling_json_path or not sample_docling_json_path.exists():
             pytest.skip("No sample Docling JSON file available")
 
-        engine = DocPivotEngine()
-        result = engine.convert_file(sample_docling_json_path)
+        result = default_engine.convert_file(sample_docling_json_path)
 
         assert isinstance(result, ConversionResult)
         assert result.format == "lexical"
         assert result.content
         assert "root" in json.loads(result.content)
 
-    def test_round_trip_conversion(self, sample_docling_json_path, temp_output_dir):
+    def test_compact_output_unless_pretty(self, sample_docling_json_path, default_engine):
+        """Test output is compact by default and indented only when pretty."""
+        if not sample_docling_json_path or not sample_docling_json_path.exists():
+            pytest.skip("No sample Docling JSON file available")
+
+        compact = default_engine.convert_file(sample_docling_json_path).content
+        pretty = default_engine.convert_file(sample_docling_json_path, pretty=True).content
+
+        assert "\n" not in compact
+        assert "\n  " in pretty
+        assert json.loads(compact) == json.loads(pretty)
+
+    def test_convert_stream_of_documents(
+        self, sample_docling_json_path, sample_docling_json_content, tmp_path, default_engine
+    ):
+        """Test each line of a newline-delimited Docling JSON file is converted."""
+        if not sample_docling_json_path or not sample_docling_json_path.exists():
+            pytest.skip("No sample Docling JSON file available")
+
+        document_line = json.dumps(sample_docling_json_content)
+        stream_path = tmp_path / "documents.jsonl"
+        stream_path.write_text(f"{document_line}\n\n{document_line}\n")
+
+        results = list(default_engine.convert_stream(stream_path))
+
+        expected = default_engine.convert_file(sample_docling_json_path).content
+        assert [result.content for result in results] == [expected, expected]
+
+    def test_convert_stream_reports_bad_line(
+        self, sample_docling_json_content, tmp_path, default_engine
+    ):
+        """Test a malformed line is reported by its line number in the file."""
+        if sample_docling_json_content is None:
+            pytest.skip("No sample Docling JSON file available")
+
+        stream_path = tmp_path / "documents.jsonl"
+        stream_path.write_text(f"{json.dumps(sample_docling_json_content)}\n{{not json\n")
+
+        results = default_engine.convert_stream(stream_path)
+        next(results)
+
+        with pytest.raises(ValidationError, match="line 2 of") as exc_info:
+            next(results)
+        assert exc_info.value.context["line_number"] == 2
+
+    def test_convert_stream_missing_file_fails_on_call(self, tmp_path, default_engine):
+        """Test a missing input file raises before any document is requested."""
+        with pytest.raises(FileAccessError):
+            default_engine.convert_stream(tmp_path / "missing.jsonl")
+
+    def test_pretty_output_honors_indent(self, sample_docling_json_path):
+        """Test the configured indent width is used for pretty output."""
+        if not sample_docling_json_path or not sample_docling_json_path.exists():
+            pytest.skip("No sample Docling JSON file available")
+
+        engine = DocPivotEngine(lexical_config={"pretty": True, "indent": 4})
+        result = engine.convert_file(sample_docling_json_path)
+
+        assert result.content.startswith('{\n    "root"')
+        assert result.metadata["pretty"] is True
+
+    def test_round_trip_conversion(self, sample_docling_json_path, temp_output_dir, default_engine):
         """Test converting Docling JSON to Lexical and saving."""
         if not sample_docling_json_path or not sample_docling_json_path.exists():
             pytest.skip("No sample Docling JSON file available")
 
-        engine = DocPivotEngine()
         output_path = temp_output_dir / "output.lexical.json"
 
         # Convert and save
-        result = engine.convert_file(sample_docling_json_path, output_path=output_path)
+        result = default_engine.convert_file(sample_docling_json_path, output_path=output_path)
 
         assert output_path.exists()
         assert result.metadata.get("output_path") == str(output_path)
 
         # Verify saved content is valid JSON
-        with Path(output_path).open() as f:
-            lexical_data = json.load(f)
-            assert "root" in lexical_data
+        lexical_data = json.loads(output_path.read_bytes())
+        assert "root" in lexical_data
 
     @pytest.mark.skipif(not Path("data/pdf").exists(), reason="PDF test data not available")
-    def test_pdf_conversion_requires_docling(self, sample_pdf_path):
+    def test_pdf_conversion_requires_docling(self, sample_pdf_path, default_engine):
         """Test PDF conversion (requires optional docling package)."""
         if not sample_pdf_path or not sample_pdf_path.exists():
             pytest.skip("No sample PDF file available")
 
-        engine = DocPivotEngine()
-
         try:
             import docling  # noqa: F401
 
             # If docling is available, test conversion
-            result = engine.convert_pdf(sample_pdf_path)
+            result = default_engine.convert_pdf(sample_pdf_path)
             assert isinstance(result, ConversionResult)
             assert result.format == "lexical"
         except ImportError:
             # If docling not available, should raise informative error
             with pytest.raises(ImportError, match="docling"):
-                engine.convert_pdf(sample_pdf_path)
+                default_engine.convert_pdf(sample_pdf_path)
 
 
 class TestEndToEndWorkflows:
     """Test complete workflows."""
 
-    def test_batch_processing(self, test_data_dir, temp_output_dir):
+    def test_batch_processing(self, test_data_dir, temp_output_dir, default_engine):
         """Test batch processing multiple files."""
         json_dir = test_data_dir / "json"
         if not json_dir.exists():
@@ -77,12 +134,11 @@ class TestEndToEndWorkflows:
         if not docling_files:
             pytest.skip("No Docling JSON files to process")
 
-        engine = DocPivotEngine()
         results = []
 
         for input_file in docling_files[:2]:  # Process max 2 files for speed
             output_file = temp_output_dir / f"{input_file.stem}.lexical.json"
-            result = engine.convert_file(input_file, output_path=output_file)
+            result = default_engine.convert_file(input_file, output_path=output_file)
             results.append(result)
             assert output_file.exists()
 
@@ -0,0 +1,208 @@
+"""Tests for LexicalDocSerializer behavior."""
+
+import io
+import json
+
+import pytest
+from docling_core.types.doc.common.origin import DocumentOrigin
+from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.labels import DocItemLabel
+
+from docpivot import DocPivotEngine, LexicalDocSerializer
+from docpivot.io.readers.exceptions import ConfigurationError, ValidationError
+from docpivot.io.serializers import LexicalParams
+
+
+def create_document(name: str = "serializer_test") -> DoclingDocument:
+    """Create a small real DoclingDocument for serializer tests that modify it."""
+    doc = DoclingDocument(
+        name=name,
+        origin=DocumentOrigin(
+            mimetype="application/pdf",
+            binary_hash=12345,
+            filename=f"{name}.pdf",
+        ),
+    )
+    doc.add_text(label=DocItemLabel.TEXT, text="Hello world")
+    return doc
+
+
+class TestMetadataCache:
+    """Test caching of the document metadata block."""
+
+    def test_metadata_block_reused_across_serialize_calls(self, sample_docling_document):
+        """Test metadata is built once and reused."""
+        serializer = LexicalDocSerializer(sample_docling_document)
+
+        first = json.loads(serializer.serialize().text)
+        cached = serializer._metadata_cache
+        second = json.loads(serializer.serialize().text)
+
+        assert first["metadata"] == second["metadata"]
+        assert first["metadata"]["document_name"] == "test_document"
+        assert serializer._metadata_cache is cached
+
+    def test_invalidate_metadata_cache_picks_up_changes(self):
+        """Test invalidating the cache reflects in-place document changes."""
+        doc = create_document()
+        serializer = LexicalDocSerializer(doc)
+        serializer.serialize()
+
+        doc.name = "renamed"
+        assert json.loads(serializer.serialize().text)["metadata"]["document_name"] == (
+            "serializer_test"
+        )
+
+        serializer.invalidate_metadata_cache()
+        assert json.loads(serializer.serialize().text)["metadata"]["document_name"] == "renamed"
+
+
+class TestNodeCache:
+    """Test the heading node cache."""
+
+    def test_cached_heading_nodes_are_independent_copies(self):
+        """Test modifying a returned node, even the first one, leaves the cache intact."""
+        doc = create_document()
+        doc.add_heading(text="Repeated heading", level=1)
+        doc.add_heading(text="Repeated heading", level=1)
+        serializer = LexicalDocSerializer(doc, params=LexicalParams(cache_node_creation=True))
+
+        first = serializer._create_heading_node_optimized(doc.texts[1])
+        second = serializer._create_heading_node_optimized(doc.texts[2])
+
+        assert first == second
+        assert len(serializer._node_cache) == 1
+        first["tag"] = "h6"
+        second["tag"] = "h5"
+        assert serializer._create_heading_node_optimized(doc.texts[1])["tag"] == "h1"
+
+
+class TestSerializeToStream:
+    """Test batched Lexical JSON emission to a stream."""
+
+    @pytest.mark.parametrize("use_fast_json", [True, False])
+    @pytest.mark.parametrize("include_metadata", [True, False])
+    def test_batched_stream_matches_serialize(self, use_fast_json, include_metadata):
+        """Test batched output is identical to the in-memory compact output."""
+        doc = create_document()
+        for i in range(5):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"Paragraph {i}")
+        params = LexicalParams(
+            indent_json=False,
+            enable_streaming=True,
+            batch_size=2,
+            use_fast_json=use_fast_json,
+            include_metadata=include_metadata,
+        )
+
+        stream = io.StringIO()
+        written = LexicalDocSerializer(doc, params=params).serialize_to_stream(stream)
+
+        expected = LexicalDocSerializer(doc, params=params).serialize().text
+        assert stream.getvalue() == expected
+        assert written == len(expected)
+
+    def test_batched_stream_reports_start_and_end_progress(self):
+        """Test the batched path reports 0.0 and 1.0 progress like serialize()."""
+        progress = []
+        params = LexicalParams(
+            indent_json=False, enable_streaming=True, progress_callback=progress.append
+        )
+
+        LexicalDocSerializer(create_document(), params=params).serialize_to_stream(io.StringIO())
+
+        assert progress[0] == 0.0
+        assert progress[-1] == 1.0
+
+    def test_invalid_document_raises_validation_error(self):
+        """Test inputs are validated before the document is inspected."""
+        params = LexicalParams(indent_json=False, enable_streaming=True)
+
+        with pytest.raises(ValidationError):
+            LexicalDocSerializer(None, params=params).serialize_to_stream(io.StringIO())
+
+    def test_indented_output_written_in_one_piece(self):
+        """Test indented output falls back to serialize()."""
+        doc = create_document()
+        stream = io.StringIO()
+
+        LexicalDocSerializer(doc).serialize_to_stream(stream)
+
+        assert stream.getvalue() == LexicalDocSerializer(doc).serialize().text
+
+
+class TestProgressCallback:
+    """Test progress reporting during the body walk."""
+
+    def test_failing_body_progress_callback_is_logged_not_raised(self, caplog):
+        """Test a callback error during the body walk does not abort serialization."""
+        calls = []
+
+        def callback(progress):
+            calls.append(progress)
+            if len(calls) == 2:  # the first update from inside the body walk
+                raise RuntimeError("callback failed")
+
+        doc = create_document()
+        params = LexicalParams(indent_json=False, progress_callback=callback)
+
+        text = LexicalDocSerializer(doc, params=params).serialize().text
+
+        assert (
+            text
+            == LexicalDocSerializer(doc, params=LexicalParams(indent_json=False)).serialize().text
+        )
+        assert calls[-1] == 1.0
+        assert "Progress callback failed" in caplog.text
+
+
+class TestIndentValidation:
+    """Test validation of the JSON indentation width."""
+
+    def test_indent_ignored_for_compact_output(self):
+        """Test compact output does not read or validate the indent."""
+        engine = DocPivotEngine(lexical_config={"pretty": False, "indent": None})
+
+        content = engine.convert_to_lexical(create_document()).content
+
+        assert "\n" not in content
+
+    @pytest.mark.parametrize("indent", [None, True, -1])
+    def test_invalid_indent_rejected_for_indented_output(self, indent):
+        """Test indented output requires a non-negative int, not a bool."""
+        params = LexicalParams(indent_json=True, json_indent=indent)
+
+        with pytest.raises(ConfigurationError, match="Invalid json_indent"):
+            LexicalDocSerializer(create_document(), params=params).serialize()
+
+
+class TestFormatFlags:
+    """Test folding of format names into the Lexical format bitmask."""
+
+    def test_format_bitmask_matches_between_paths(self, sample_docling_document):
+        """Test both text node builders produce the same bitmask."""
+        serializer = LexicalDocSerializer(sample_docling_document)
+        formats = ["bold", "underline", "unknown"]
+
+        optimized = serializer._create_formatted_text_node_optimized("x", formats)
+        standard = serializer._create_formatted_text_node("x", formats)
+
+        assert optimized["format"] == standard["format"] == 1 | 4
+
+
+class TestParallelProcessing:
+    """Test the parallel transformation path."""
+
+    def test_parallel_output_keeps_document_order(self):
+        """Test chunk results are reassembled in body order."""
+        doc = create_document()
+        for i in range(20):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"Paragraph {i}")
+        params = LexicalParams(
+            parallel_processing=True, max_workers=4, enable_streaming=False, indent_json=False
+        )
+
+        parallel = LexicalDocSerializer(doc, params=params)._transform_docling_to_lexical_parallel()
+        sequential = LexicalDocSerializer(doc, params=params)._transform_docling_to_lexical()
+
+        assert parallel["root"]["children"] == sequential["root"]["children"]
@@ -0,0 +1,156 @@
+"""Tests for reader format detection and custom reader validation."""
+
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+from docling_core.types.doc.document import DoclingDocument
+
+from docpivot.io import CustomReaderBase
+from docpivot.io.readers import ReaderFactory
+
+DOCLING_JSON = "json/2025-07-03-Test-PDF-Styles.docling.json"
+LEXICAL_JSON = "json/2025-07-03-Test-PDF-Styles.lexical.json"
+PDF = "pdf/2025-07-03-Test-PDF-Styles.pdf"
+
+# Capabilities a CustomReaderBase subclass reports unless it overrides them
+EXPECTED_DEFAULT_CAPABILITIES = MappingProxyType(
+    {
+        "text_extraction": True,
+        "metadata_extraction": False,
+        "structure_preservation": True,
+        "embedded_images": False,
+        "embedded_tables": False,
+    }
+)
+
+
+# Custom readers are declared once here rather than inside each test
+class ValidReader(CustomReaderBase):
+    """Minimal, correctly configured custom reader."""
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        return [".test"]
+
+    @property
+    def format_name(self) -> str:
+        return "Test Format"
+
+    def can_handle(self, file_path: str | Path) -> bool:
+        return Path(file_path).suffix.lower() in self.supported_extensions
+
+    def load_data(self, file_path: str | Path, **kwargs: Any) -> DoclingDocument:
+        return self._create_empty_document()
+
+
+class NoExtensionsReader(ValidReader):
+    """Reader declaring no extensions."""
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        return []
+
+
+class NoFormatNameReader(ValidReader):
+    """Reader declaring an empty format name."""
+
+    @property
+    def format_name(self) -> str:
+        return ""
+
+
+class BadExtensionReader(ValidReader):
+    """Reader declaring an extension without the leading dot."""
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        return ["test"]
+
+
+class TestDetectFormat:
+    """Test each reader recognizes only its own format."""
+
+    @pytest.mark.parametrize(
+        ("reader_fixture", "relative_path", "expected"),
+        [
+            ("docling_reader", DOCLING_JSON, True),
+            ("docling_reader", LEXICAL_JSON, False),
+            ("docling_reader", PDF, False),
+            ("docling_reader", "json/missing.docling.json", False),
+            ("lexical_reader", LEXICAL_JSON, True),
+            ("lexical_reader", DOCLING_JSON, False),
+            ("lexical_reader", PDF, False),
+            ("lexical_reader", "json/missing.lexical.json", False),
+        ],
+    )
+    def test_detect_format(self, request, test_data_dir, reader_fixture, relative_path, expected):
+        """Test detect_format against sample files and a missing path."""
+        path = test_data_dir / relative_path
+        if expected and not path.exists():
+            pytest.skip(f"Sample file not available: {relative_path}")
+
+        reader = request.getfixturevalue(reader_fixture)
+        assert reader.detect_format(path) is expected
+
+
+class TestReaderFactory:
+    """Test ReaderFactory reader selection."""
+
+    def test_get_reader_returns_new_reader_each_call(self, test_data_dir):
+        """Test settings on one returned reader do not leak into later calls."""
+        path = test_data_dir / DOCLING_JSON
+        if not path.exists():
+            pytest.skip(f"Sample file not available: {DOCLING_JSON}")
+        factory = ReaderFactory()
+
+        first = factory.get_reader(path)
+        first.enable_caching = True
+        second = factory.get_reader(path)
+
+        assert second is not first
+        assert second.enable_caching is False
+        assert factory.detect_format(path) == "docling"
+
+
+class TestCustomReaderValidation:
+    """Test CustomReaderBase rejects misconfigured readers at construction."""
+
+    def test_valid_reader(self):
+        """Test a correctly configured reader can be built with default metadata."""
+        reader = ValidReader()
+
+        assert reader.format_name == "Test Format"
+        assert reader.capabilities == EXPECTED_DEFAULT_CAPABILITIES
+
+    @pytest.mark.parametrize(
+        ("reader_class", "message"),
+        [
+            (NoExtensionsReader, "must define supported_extensions"),
+            (NoFormatNameReader, "must define format_name"),
+            (BadExtensionReader, "must start with '.'"),
+        ],
+    )
+    def test_invalid_configuration(self, reader_class, message):
+        """Test each misconfiguration raises ValueError."""
+        with pytest.raises(ValueError, match=re.escape(message)):
+            reader_class()
+
+    @pytest.mark.parametrize(
+        ("prop", "value"),
+        [
+            ("format_description", "Plain test files"),
+            ("version", "2.0.0"),
+            ("capabilities", {"text_extraction": True, "metadata_extraction": True}),
+        ],
+    )
+    def test_optional_property_override(self, prop, value):
+        """Test subclasses can override the optional metadata properties."""
+        reader_class = type("OverrideReader", (ValidReader,), {prop: property(lambda _: value)})
+
+        reader = reader_class()
+
+        assert getattr(reader, prop) == value
+        assert getattr(ValidReader(), prop) != value